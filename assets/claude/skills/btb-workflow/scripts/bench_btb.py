@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Benchmark the BTB scripts on synthetic git repositories.
+
+Generates repositories offline with `git fast-import` (commit count,
+HUMAN/Claude mix, SPECS/ file count, PROGRESS.md size are configurable),
+then runs each script entry point in a fresh interpreter and records:
+- wall time (min and median over --repeat runs)
+- peak RSS of the interpreter and of the processes it spawned
+- the number of subprocesses spawned (counted with an audit hook)
+
+Results are written as JSON; --compare prints the change against an
+earlier results file so regressions show up between versions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# name -> script and arguments, run from the repository root
+ENTRY_POINTS = {
+    "status": ["btb_status.py", "--no-cache"],
+    "status-cached": ["btb_status.py"],
+    "status-history": ["btb_status.py", "--all"],
+    "status-timeline": ["btb_status.py", "--timeline"],
+    "validate": ["validate_progress.py"],
+    "btb-validate": ["btb.py", "validate"],
+    "init": ["init_btb.py"],
+}
+
+# Entry points that must pass on the generated repository; a failure means
+# the benchmark timed an early error exit instead of the validation
+MUST_PASS = {"validate", "btb-validate"}
+
+PRESETS = {
+    "small": {"commits": 200, "specs_files": 20, "progress_lines": 100},
+    "medium": {"commits": 10_000, "specs_files": 500, "progress_lines": 1_000},
+    "large": {"commits": 200_000, "specs_files": 5_000, "progress_lines": 10_000},
+}
+
+# Runs one script under an audit hook; the report is written from the first
+# registered atexit handler, which runs last (after the script's own
+# cleanup has reaped its child processes).
+RUNNER = """
+import atexit, json, os, resource, runpy, sys
+spawns = 0
+def audit(event, args):
+    global spawns
+    if event in ("subprocess.Popen", "os.posix_spawn", "os.system"):
+        spawns += 1
+sys.addaudithook(audit)
+report, script, *argv = sys.argv[1:]
+# ru_maxrss is in bytes on macOS and in KiB elsewhere
+scale = 1024 if sys.platform == "darwin" else 1
+def maxrss(who):
+    return resource.getrusage(who).ru_maxrss // scale
+def write_report():
+    with open(report, "w") as f:
+        json.dump({
+            "spawns": spawns,
+            "rss_kb": maxrss(resource.RUSAGE_SELF),
+            "children_rss_kb": maxrss(resource.RUSAGE_CHILDREN),
+        }, f)
+atexit.register(write_report)
+sys.argv = [script, *argv]
+sys.path.insert(0, os.path.dirname(script))
+runpy.run_path(script, run_name="__main__")
+"""
+
+
+def today() -> str:
+    return datetime.now().strftime("%B %d, %Y")
+
+
+def progress_markdown(lines: int, branch: str) -> str:
+    """A PROGRESS.md with valid header fields and `lines` lines of tasks."""
+    tasks = [f"- [{'x' if i % 3 == 0 else ' '}] Task {i}" for i in range(lines)]
+    return (
+        "# bench - Progress Report\n\n"
+        f"**Report Date**: {today()}\n"
+        f"**Branch**: `{branch}`\n"
+        "**Current Phase**: Phase 1 ✅\n\n"
+        "## Next Steps\n\n" + "\n".join(tasks) + "\n"
+    )
+
+
+def generate_repo(
+    path: Path,
+    commits: int,
+    human_ratio: float,
+    claude_ratio: float,
+    specs_files: int,
+    progress_lines: int,
+    seed: int = 0,
+) -> None:
+    """Create a synthetic BTB repository with a single `git fast-import`.
+
+    The import stream is written incrementally: Linux carries a process's
+    peak RSS over into the children it spawns, so holding the whole stream
+    here would inflate every later RSS measurement.
+    """
+    rng = random.Random(seed)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    importer = subprocess.Popen(
+        ["git", "-C", str(path), "fast-import", "--quiet"], stdin=subprocess.PIPE
+    )
+    stream = importer.stdin
+
+    def blob(name: str, content: str) -> None:
+        data = content.encode()
+        stream.write(
+            b"M 100644 inline %s\ndata %d\n%s\n" % (name.encode(), len(data), data)
+        )
+
+    start = int(time.time()) - commits * 600
+    for i in range(commits):
+        roll = rng.random()
+        if roll < human_ratio:
+            author, message = "Human", f"HUMAN: update requirements {i}"
+        elif roll < human_ratio + claude_ratio:
+            author, message = "Claude", f"feat: implement step {i}"
+        else:
+            author, message = "Dev", f"fix: adjust {i}"
+        msg = message.encode()
+        stream.write(
+            b"commit refs/heads/main\nmark :%d\n"
+            b"author %s <%s@example.com> %d +0000\n"
+            b"committer %s <%s@example.com> %d +0000\n"
+            b"data %d\n%s\n"
+            % (
+                i + 1,
+                author.encode(),
+                author.encode(),
+                start + i * 600,
+                author.encode(),
+                author.encode(),
+                start + i * 600,
+                len(msg),
+                msg,
+            )
+        )
+        if i:
+            stream.write(b"from :%d\n" % i)
+        blob(f"src/module{i % 50}.py", f"VALUE = {i}\n")
+        if i % 10 == 0 or i == commits - 1:
+            blob("SPECS/PROGRESS.md", progress_markdown(progress_lines, "main"))
+        if i == 0:
+            blob("SPECS/README.md", "# bench - Documentation Guide\n")
+        if i == commits - 1:
+            for n in range(specs_files):
+                kind = ("design", "MVP", "notes")[n % 3]
+                blob(f"SPECS/area{n % 20}/{kind}-{n}.md", f"# {kind} {n}\n")
+        stream.write(b"\n")
+
+    stream.close()
+    if importer.wait():
+        raise subprocess.CalledProcessError(importer.returncode, importer.args)
+    subprocess.run(["git", "-C", str(path), "repack", "-adq"], check=True)
+    subprocess.run(["git", "-C", str(path), "reset", "-q", "--hard"], check=True)
+    # Stage a modified PROGRESS.md so validate_progress takes its full path
+    (path / "SPECS" / "PROGRESS.md").write_text(
+        progress_markdown(progress_lines + 1, "main")
+    )
+    subprocess.run(["git", "-C", str(path), "add", "SPECS/PROGRESS.md"], check=True)
+
+
+def run_entry(repo: Path, argv: list[str], report: Path) -> dict:
+    """Run one entry point in a fresh interpreter and return its measurements."""
+    script = str(SCRIPTS_DIR / argv[0])
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", RUNNER, str(report), script, *argv[1:]],
+        cwd=repo,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    result = json.loads(report.read_text()) if report.exists() else {}
+    result.update(wall_s=elapsed, exit_code=proc.returncode)
+    if proc.returncode:
+        result["output"] = (proc.stdout + proc.stderr)[-2000:]
+    return result
+
+
+def benchmark(repo: Path, entries: list[str], repeat: int) -> dict:
+    """Run every selected entry point `repeat` times and summarize."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "report.json"
+        for name in entries:
+            runs = [run_entry(repo, ENTRY_POINTS[name], report) for _ in range(repeat)]
+            failed = next((run for run in runs if run["exit_code"]), None)
+            if name in MUST_PASS and failed:
+                raise SystemExit(
+                    f"❌ {name} exited with {failed['exit_code']} on the generated "
+                    f"repository:\n{failed['output']}"
+                )
+            walls = [run["wall_s"] for run in runs]
+            last = runs[-1]
+            results[name] = {
+                "wall_min_s": round(min(walls), 4),
+                "wall_median_s": round(statistics.median(walls), 4),
+                "peak_rss_kb": max(run.get("rss_kb", 0) for run in runs),
+                "children_peak_rss_kb": max(
+                    run.get("children_rss_kb", 0) for run in runs
+                ),
+                "spawns": last.get("spawns"),
+                "exit_code": last["exit_code"],
+            }
+            if last["exit_code"] not in (0, 1):
+                results[name]["output"] = last["output"]
+            print(
+                f"   {name:<16} {results[name]['wall_median_s'] * 1000:>9.1f} ms"
+                f" {results[name]['peak_rss_kb'] / 1024:>8.1f} MB"
+                f" {results[name]['spawns']!s:>7} spawns"
+            )
+    return results
+
+
+def scripts_revision() -> str | None:
+    """The git revision of the scripts being measured, if available."""
+    proc = subprocess.run(
+        ["git", "-C", str(SCRIPTS_DIR), "describe", "--always", "--dirty"],
+        capture_output=True,
+        text=True,
+    )
+    return proc.stdout.strip() or None
+
+
+def print_comparison(current: dict, baseline: dict) -> None:
+    """Print median wall time and spawn changes against a baseline run."""
+    print(f"\n📉 Compared with {baseline.get('revision') or 'baseline'}:")
+    for size, results in current["results"].items():
+        previous = baseline.get("results", {}).get(size, {})
+        for name, result in results.items():
+            before = previous.get(name)
+            if not before:
+                continue
+            ratio = result["wall_median_s"] / before["wall_median_s"]
+            flag = "⚠️ " if ratio > 1.1 else "  "
+            print(
+                f"   {flag}{size}/{name:<16} {ratio:>6.2f}x wall,"
+                f" spawns {before['spawns']} -> {result['spawns']}"
+            )
+
+
+def main():
+    """Generate repositories, run the benchmarks and write JSON results."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark BTB scripts on synthetic repositories"
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        choices=sorted(PRESETS),
+        help="Repository size preset (repeatable; default: small)",
+    )
+    parser.add_argument("--commits", type=int, help="Override the preset commit count")
+    parser.add_argument(
+        "--specs-files", type=int, help="Override the preset SPECS/ file count"
+    )
+    parser.add_argument(
+        "--progress-lines", type=int, help="Override the preset PROGRESS.md length"
+    )
+    parser.add_argument(
+        "--human-ratio",
+        type=float,
+        default=0.2,
+        help="Share of HUMAN: commits (default: 0.2)",
+    )
+    parser.add_argument(
+        "--claude-ratio",
+        type=float,
+        default=0.6,
+        help="Share of Claude commits (default: 0.6)",
+    )
+    parser.add_argument(
+        "--entry",
+        action="append",
+        choices=list(ENTRY_POINTS),
+        help="Entry point to measure (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per entry point (default: 3)"
+    )
+    parser.add_argument(
+        "--output",
+        default="btb-bench.json",
+        help="Results file (default: btb-bench.json)",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier results file to compare against"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated repositories"
+    )
+    args = parser.parse_args()
+
+    entries = args.entry or list(ENTRY_POINTS)
+    workdir = Path(tempfile.mkdtemp(prefix="btb-bench-"))
+    output = {
+        "revision": scripts_revision(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repos": {},
+        "results": {},
+    }
+
+    try:
+        for size in args.size or ["small"]:
+            params = dict(PRESETS[size])
+            for key in ("commits", "specs_files", "progress_lines"):
+                if getattr(args, key) is not None:
+                    params[key] = getattr(args, key)
+            params.update(human_ratio=args.human_ratio, claude_ratio=args.claude_ratio)
+
+            repo = workdir / size
+            print(f"🏗️  Generating {size} repository: {params}")
+            started = time.perf_counter()
+            generate_repo(repo, **params)
+            print(f"   generated in {time.perf_counter() - started:.1f}s\n")
+
+            output["repos"][size] = params
+            output["results"][size] = benchmark(repo, entries, args.repeat)
+            print()
+    finally:
+        if args.keep:
+            print(f"Repositories kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+    print(f"✅ Results written to {args.output}")
+
+    if args.compare:
+        print_comparison(output, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
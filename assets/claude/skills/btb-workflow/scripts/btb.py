@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unified BTB command line: `btb status`, `btb validate` and `btb init`.
+
+Only `sys` is imported up front. Each subcommand imports its own module
+when it runs, and all of them share one repository lookup (btb_git), so
+`btb validate` pays only for what validation needs.
+"""
+
+import sys
+
+USAGE = """usage: btb <command> [options]
+
+commands:
+    status      Display BTB workflow status
+    validate    Validate PROGRESS.md before a commit
+    init        Initialize BTB workflow in a repository
+    daemon      Start, stop or query the resident validator daemon
+    hook        Pre-commit hook: validate through the daemon if running
+    zipapp      Package these scripts as a single file (default: btb.pyz)
+
+Run `btb <command> --help` for the options of a command."""
+
+COMMANDS = {
+    "status": "btb_status",
+    "validate": "validate_progress",
+    "init": "init_btb",
+    "daemon": "btb_daemon",
+    "hook": "btb_hook",
+}
+
+# Modules shipped in the zipapp, in addition to this one
+MODULES = (
+    "btb_daemon",
+    "btb_git",
+    "btb_hook",
+    "btb_status",
+    "init_btb",
+    "progress_doc",
+    "specs_index",
+    "validate_progress",
+)
+
+
+def build_zipapp(output: str = "btb.pyz") -> None:
+    """Package the BTB modules, with precompiled bytecode, as an executable zipapp.
+
+    zipimport cannot write bytecode caches, so each module's .pyc is stored
+    next to its source in the archive to avoid compiling on every run.
+    """
+    import py_compile
+    import shutil
+    import tempfile
+    import zipapp
+    from pathlib import Path
+
+    source_dir = Path(__file__).resolve().parent
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        for name in ("btb", *MODULES):
+            shutil.copy2(source_dir / f"{name}.py", staging / f"{name}.py")
+            py_compile.compile(
+                str(staging / f"{name}.py"),
+                cfile=str(staging / f"{name}.pyc"),
+                dfile=f"{name}.py",
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+        zipapp.create_archive(
+            staging, output, interpreter="/usr/bin/env python3", main="btb:main"
+        )
+    print(f"✅ Wrote {output}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Dispatch to a BTB subcommand."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(USAGE)
+        return
+
+    command, rest = argv[0], argv[1:]
+    if command == "zipapp":
+        build_zipapp(*rest[:1])
+        return
+    if command not in COMMANDS:
+        print(f"btb: unknown command '{command}'\n", file=sys.stderr)
+        print(USAGE, file=sys.stderr)
+        sys.exit(2)
+
+    module = __import__(COMMANDS[command])
+    sys.argv[0] = f"btb {command}"
+    module.main(rest)
+
+
+if __name__ == "__main__":
+    main()
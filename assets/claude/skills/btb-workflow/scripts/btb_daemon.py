@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Resident BTB validator daemon.
+
+Answers validate_progress checks for one repository over a unix socket
+(.git/btb-validate.sock), so commits skip Python startup and, while
+nothing has changed, the `git status` call. The repository handle, the
+parsed PROGRESS.md and the last status result stay in memory; the status
+is keyed on the stat of HEAD, the index, the branch and upstream refs,
+the config and PROGRESS.md, so any change is picked up by the next
+request. Use btb_hook.py as the pre-commit hook: it falls back to
+in-process validation whenever the daemon is not running.
+
+Commands:
+    start   Start the daemon in the background
+    stop    Stop a running daemon
+    status  Report whether the daemon is running
+    serve   Run the daemon in the foreground
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+from btb_git import GitError, GitRepo, open_repo
+from btb_hook import request, socket_path
+from validate_progress import find_progress, validate, validate_packages
+
+DEFAULT_IDLE_TIMEOUT = 3600
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class ValidatorDaemon:
+    """Validation state for one repository, kept warm between requests."""
+
+    def __init__(self, repo: GitRepo):
+        self.repo = repo
+        self._status: tuple[tuple, dict] | None = None
+        self.requests = 0
+        self.status_hits = 0
+
+    def fingerprint(self, progress_path: Path, index_file: Path) -> tuple:
+        """Stats of every file the `git status` result depends on."""
+        repo = self.repo
+        paths = [
+            repo.git_dir / "HEAD",
+            index_file,
+            progress_path,
+            repo.common_dir / "config",
+            repo.common_dir / "packed-refs",
+        ]
+        head_ref = repo.head_ref()
+        if head_ref:
+            paths.append(repo.common_dir / head_ref)
+        if self._status and self._status[1]["upstream"]:
+            upstream = self._status[1]["upstream"]
+            paths.append(repo.common_dir / "refs" / "remotes" / upstream)
+            paths.append(repo.common_dir / "refs" / "heads" / upstream)
+        return tuple((str(path), _stat_key(path)) for path in paths)
+
+    def status(self, progress_path: Path, index_file: str) -> dict:
+        """`GitRepo.status()` for PROGRESS.md, reused while nothing changed."""
+        index = Path(index_file) if index_file else self.repo.git_dir / "index"
+        key = self.fingerprint(progress_path, index)
+        if self._status and self._status[0] == key:
+            self.status_hits += 1
+            return self._status[1]
+
+        state = self.repo.status(progress_path.relative_to(self.repo.root).as_posix())
+        # Key on the fingerprint taken before the call, so a change made
+        # while git was running invalidates the entry on the next request
+        self._status = (key, state)
+        return state
+
+    def handle(self, fields: list[str]) -> tuple[int, str]:
+        """Answer one request; returns the exit code and output."""
+        command, args = fields[0], fields[1:]
+        if command == "ping":
+            return 0, (
+                f"btb daemon {os.getpid()} serving {self.repo.root} "
+                f"({self.requests} validations, {self.status_hits} status reuses)\n"
+            )
+        if command != "validate":
+            return 2, f"btb daemon: unknown request '{command}'\n"
+
+        self.requests += 1
+        index_file, options = (args[0], args[1:]) if args else ("", [])
+        if not set(options) <= {"--packages", "--worktree"}:
+            return 2, f"btb daemon: unsupported options {' '.join(options)}\n"
+        worktree = "--worktree" in options
+
+        # git commands and index reads follow the hook's index for this request
+        if index_file:
+            os.environ["GIT_INDEX_FILE"] = index_file
+        try:
+            if "--packages" in options:
+                code, report = validate_packages(self.repo, worktree)
+            else:
+                progress_path = find_progress(self.repo)
+                try:
+                    state = self.status(progress_path, index_file)
+                except GitError as e:
+                    return 1, f"Error: {e}\n"
+                code, report = validate(self.repo, progress_path, state, worktree)
+        finally:
+            os.environ.pop("GIT_INDEX_FILE", None)
+        return code, "\n".join(report) + "\n"
+
+    def serve(self, path: str, idle_timeout: float) -> None:
+        """Accept requests until stopped or idle for `idle_timeout` seconds."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(path)
+            os.chmod(path, 0o600)
+            server.listen(16)
+            server.settimeout(idle_timeout)
+            try:
+                while True:
+                    try:
+                        conn, _ = server.accept()
+                    except TimeoutError:
+                        break
+                    with conn:
+                        if not self._answer(conn):
+                            break
+            finally:
+                os.unlink(path)
+
+    def _answer(self, conn: socket.socket) -> bool:
+        """Reply to one connection; returns False when asked to stop."""
+        conn.settimeout(10)
+        chunks = []
+        try:
+            while chunk := conn.recv(65536):
+                chunks.append(chunk)
+        except OSError:
+            return True
+        fields = b"".join(chunks).decode(errors="replace").split("\0")
+        if fields[0] == "stop":
+            conn.sendall(b"0\nbtb daemon stopped\n")
+            return False
+        try:
+            code, output = self.handle(fields)
+        except Exception:
+            # Closing without a verdict makes the client validate in-process
+            return True
+        try:
+            conn.sendall(f"{code}\n{output}".encode())
+        except OSError:
+            pass
+        return True
+
+
+def serve(repo: GitRepo, idle_timeout: float) -> int:
+    """Run the daemon in the foreground."""
+    path = socket_path(str(repo.git_dir))
+    if request(path, "ping", timeout=2) is not None:
+        print(f"btb daemon already running on {path}")
+        return 1
+    if os.path.exists(path):
+        os.unlink(path)  # left behind by a daemon that died
+
+    # A daemon started from a hook must not inherit the hook's index
+    os.environ.pop("GIT_INDEX_FILE", None)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    ValidatorDaemon(repo).serve(path, idle_timeout)
+    return 0
+
+
+def start(repo: GitRepo, idle_timeout: float) -> int:
+    """Start the daemon as a detached background process."""
+    import subprocess
+
+    path = socket_path(str(repo.git_dir))
+    reply = request(path, "ping", timeout=2)
+    if reply is not None:
+        print(f"✅ {reply[1].strip()}")
+        return 0
+
+    # -c instead of the script path also works when running from a zipapp
+    bootstrap = (
+        f"import sys; sys.path.insert(0, {os.path.dirname(__file__)!r}); "
+        "import btb_daemon; "
+        f"btb_daemon.main(['serve', '--idle-timeout', {str(idle_timeout)!r}])"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "GIT_INDEX_FILE"}
+    subprocess.Popen(
+        [sys.executable, "-c", bootstrap],
+        cwd=repo.root,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        reply = request(path, "ping", timeout=2)
+        if reply is not None:
+            print(f"✅ {reply[1].strip()}")
+            return 0
+        time.sleep(0.05)
+    print("❌ btb daemon did not start")
+    return 1
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Manage the validator daemon of the current repository."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Resident BTB validator daemon "
+            "(pair with btb_hook.py as the pre-commit hook)"
+        )
+    )
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=(
+            "Exit after this many seconds without requests "
+            f"(default: {DEFAULT_IDLE_TIMEOUT})"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the BTB daemon needs unix domain sockets")
+        sys.exit(1)
+
+    repo = open_repo()
+    if args.command == "serve":
+        sys.exit(serve(repo, args.idle_timeout))
+    if args.command == "start":
+        sys.exit(start(repo, args.idle_timeout))
+
+    reply = request(
+        socket_path(str(repo.git_dir)),
+        "stop" if args.command == "stop" else "ping",
+        timeout=2,
+    )
+    if reply is None:
+        print("btb daemon is not running")
+        sys.exit(0 if args.command == "stop" else 1)
+    print(reply[1].strip())
+
+
+if __name__ == "__main__":
+    main()
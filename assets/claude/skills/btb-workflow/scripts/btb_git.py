@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+"""
+In-process git access shared by the BTB scripts.
+
+Reads .git/HEAD, loose refs, packed-refs and loose/packed objects directly,
+so the common queries (repository root, current branch, recent log) do not
+spawn a `git` process. Objects the reader cannot resolve itself (alternates,
+partial clones, SHA-256 repositories) are fetched through a single persistent
+`git cat-file --batch` process that is started on first use.
+"""
+
+import atexit
+import os
+import sys
+import zlib
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+
+class GitError(Exception):
+    """Raised when the repository cannot be read."""
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write a file via a temporary name and rename, so readers never see it half-written.
+
+    Raises OSError after removing the temporary file if the write fails.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _config_value(git_dir: Path, section: str, key: str) -> str | None:
+    """Read one `section.key` setting from a repository's own config file."""
+    current = ""
+    for line in (_read_text(git_dir / "config") or "").splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            current = line.strip("[]").strip().lower()
+        elif current == section and "=" in line:
+            name, value = line.split("=", 1)
+            if name.strip().lower() == key:
+                return value.strip().strip('"')
+    return None
+
+
+def _core_worktree(git_dir: Path) -> Path | None:
+    """The `core.worktree` setting of a repository, if any (relative to the git dir)."""
+    value = _config_value(git_dir, "core", "worktree")
+    return (git_dir / value).resolve() if value else None
+
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a little-endian base-128 size as used in delta headers."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its delta base and delta instructions."""
+    _, pos = _varint(delta, 0)
+    target_size, pos = _varint(delta, pos)
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (1 << (4 + i)):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset : offset + (size or 0x10000)]
+        elif op:
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise GitError("Invalid delta instruction")
+    if len(out) != target_size:
+        raise GitError("Delta produced an object of the wrong size")
+    return bytes(out)
+
+
+class CatFileBatch:
+    """A persistent `git cat-file --batch` process, started on first read."""
+
+    def __init__(self, git_dir: Path):
+        self.git_dir = git_dir
+        self._proc = None
+
+    def _start(self):
+        if self._proc is None:
+            import subprocess
+
+            self._proc = subprocess.Popen(
+                ["git", f"--git-dir={self.git_dir}", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def _read_result(self) -> tuple[str, bytes] | None:
+        header = self._proc.stdout.readline().split()
+        if len(header) != 3:
+            return None
+        size = int(header[2])
+        content = self._proc.stdout.read(size + 1)[:size]
+        return header[1].decode(), content
+
+    def read(self, spec: str) -> tuple[str, bytes] | None:
+        """Return (type, content) for an object name or `rev:path` spec."""
+        proc = self._start()
+        proc.stdin.write(spec.encode() + b"\n")
+        proc.stdin.flush()
+        return self._read_result()
+
+    def read_many(self, specs: list[str]) -> Iterator[tuple[str, bytes] | None]:
+        """Pipeline many reads, yielding results in order.
+
+        Requests are written from a helper thread while results are read,
+        so the batch process never waits on a round trip per object.
+        """
+        import threading
+
+        proc = self._start()
+
+        def feed() -> None:
+            for spec in specs:
+                proc.stdin.write(spec.encode() + b"\n")
+            proc.stdin.flush()
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        for _ in specs:
+            yield self._read_result()
+        writer.join()
+
+    def close(self) -> None:
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+
+class PackFile:
+    """A packfile and its version 2 index, memory-mapped on open."""
+
+    def __init__(self, idx_path: Path):
+        import mmap
+
+        with open(idx_path, "rb") as f:
+            self._idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._idx[:8] != b"\377tOc\x00\x00\x00\x02":
+            raise GitError(f"Unsupported pack index: {idx_path}")
+        with open(idx_path.with_suffix(".pack"), "rb") as f:
+            self._pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = int.from_bytes(self._idx[8 + 255 * 4 : 8 + 256 * 4], "big")
+        self._bases: dict[int, tuple[int, bytes]] = {}
+
+    def find(self, sha: bytes) -> int | None:
+        """Return the pack offset of a binary SHA-1, or None."""
+        first = sha[0]
+        lo = int.from_bytes(self._idx[8 + (first - 1) * 4 : 8 + first * 4], "big") if first else 0
+        hi = int.from_bytes(self._idx[8 + first * 4 : 12 + first * 4], "big")
+        table = 8 + 256 * 4
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._idx[table + mid * 20 : table + mid * 20 + 20]
+            if entry < sha:
+                lo = mid + 1
+            elif entry > sha:
+                hi = mid
+            else:
+                offsets = table + self._count * 24
+                offset = int.from_bytes(self._idx[offsets + mid * 4 : offsets + mid * 4 + 4], "big")
+                if offset & 0x80000000:
+                    large = offsets + self._count * 4 + (offset & 0x7FFFFFFF) * 8
+                    offset = int.from_bytes(self._idx[large : large + 8], "big")
+                return offset
+        return None
+
+    def _inflate(self, pos: int) -> bytes:
+        inflater = zlib.decompressobj()
+        chunks = []
+        while not inflater.eof:
+            chunk = self._pack[pos : pos + 65536]
+            if not chunk:
+                raise GitError("Truncated packfile")
+            chunks.append(inflater.decompress(chunk))
+            pos += 65536
+        return b"".join(chunks)
+
+    def read(self, offset: int, repo: "GitRepo") -> tuple[int, bytes]:
+        """Return (type number, content) of the object at `offset`."""
+        if offset in self._bases:
+            return self._bases[offset]
+        pos = offset
+        byte = self._pack[pos]
+        pos += 1
+        kind = (byte >> 4) & 7
+        while byte & 0x80:
+            byte = self._pack[pos]
+            pos += 1
+        if kind == OFS_DELTA:
+            byte = self._pack[pos]
+            pos += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = self._pack[pos]
+                pos += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_kind, base = self.read(offset - distance, repo)
+            result = base_kind, _apply_delta(base, self._inflate(pos))
+        elif kind == REF_DELTA:
+            base_type, base = repo.read_object(self._pack[pos : pos + 20].hex())
+            types = {name: number for number, name in OBJECT_TYPES.items()}
+            result = types[base_type], _apply_delta(base, self._inflate(pos + 20))
+        else:
+            result = kind, self._inflate(pos)
+        if len(self._bases) > 256:
+            self._bases.clear()
+        self._bases[offset] = result
+        return result
+
+    def close(self) -> None:
+        self._idx.close()
+        self._pack.close()
+
+
+class GitRepo:
+    """Read-only view of a git repository that avoids spawning `git`."""
+
+    def __init__(self, root: Path, git_dir: Path):
+        self.root = root
+        self.git_dir = git_dir
+        common = _read_text(git_dir / "commondir")
+        self.common_dir = (git_dir / common).resolve() if common else git_dir
+        self._packs: list[PackFile] | None = None
+        self._batch = CatFileBatch(git_dir)
+        self._shallow: set[str] | None = None
+        # SHA-1 (20-byte) object ids unless the repository uses SHA-256
+        object_format = _config_value(self.common_dir, "extensions", "objectformat")
+        self.hash_size = 32 if (object_format or "").lower() == "sha256" else 20
+
+    @classmethod
+    def discover(cls, start: Path | None = None) -> "GitRepo | None":
+        """Find the repository containing `start` (default: cwd, or $GIT_DIR)."""
+        if start is None and "GIT_DIR" in os.environ:
+            git_dir = Path(os.environ["GIT_DIR"]).resolve()
+            # git's rule: $GIT_WORK_TREE, then core.worktree, then the current
+            # directory (the parent of GIT_DIR is wrong for linked worktrees)
+            if "GIT_WORK_TREE" in os.environ:
+                root = Path(os.environ["GIT_WORK_TREE"]).resolve()
+            else:
+                root = _core_worktree(git_dir) or Path.cwd().resolve()
+            return cls(root, git_dir)
+        path = (start or Path.cwd()).resolve()
+        for candidate in (path, *path.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                return cls(candidate, dot_git)
+            if dot_git.is_file():
+                pointer = _read_text(dot_git) or ""
+                if pointer.startswith("gitdir:"):
+                    return cls(candidate, (candidate / pointer[7:].strip()).resolve())
+        return None
+
+    # Refs
+
+    def _ref_dir(self, ref: str) -> Path:
+        per_worktree = ref == "HEAD" or not ref.startswith("refs/") or ref.startswith(
+            ("refs/bisect/", "refs/worktree/", "refs/rewritten/")
+        )
+        return self.git_dir if per_worktree else self.common_dir
+
+    def _packed_refs(self) -> dict[str, str]:
+        refs = {}
+        text = _read_text(self.common_dir / "packed-refs") or ""
+        for line in text.splitlines():
+            if line and line[0] not in "#^":
+                sha, _, name = line.partition(" ")
+                refs[name] = sha
+        return refs
+
+    def resolve_ref(self, ref: str) -> str | None:
+        """Resolve a full ref name (following symbolic refs) to a SHA."""
+        for _ in range(10):
+            value = _read_text(self._ref_dir(ref) / ref)
+            if value is None:
+                return self._packed_refs().get(ref)
+            if not value.startswith("ref:"):
+                return value
+            ref = value[4:].strip()
+        raise GitError(f"Symbolic ref loop at {ref}")
+
+    def head_ref(self) -> str | None:
+        """Return the ref HEAD points to, or None when detached."""
+        head = _read_text(self.git_dir / "HEAD") or ""
+        return head[4:].strip() if head.startswith("ref:") else None
+
+    def head_sha(self) -> str | None:
+        """Return the commit SHA HEAD points to, or None on an unborn branch."""
+        return self.resolve_ref("HEAD")
+
+    def current_branch(self) -> str:
+        """Return the short branch name, or "HEAD" when detached."""
+        ref = self.head_ref()
+        if ref is None:
+            return "HEAD"
+        return ref.removeprefix("refs/heads/")
+
+    # Objects
+
+    def _load_packs(self) -> list[PackFile]:
+        if self._packs is None:
+            self._packs = []
+            pack_dir = self.common_dir / "objects" / "pack"
+            for idx_path in sorted(pack_dir.glob("*.idx")):
+                try:
+                    self._packs.append(PackFile(idx_path))
+                except (GitError, OSError, ValueError):
+                    continue
+        return self._packs
+
+    def read_object(self, sha: str) -> tuple[str, bytes]:
+        """Return (type, content) of an object by its hex name."""
+        if len(sha) == 40:
+            loose = self.common_dir / "objects" / sha[:2] / sha[2:]
+            try:
+                raw = zlib.decompress(loose.read_bytes())
+            except (OSError, zlib.error):
+                raw = None
+            if raw is not None:
+                header, _, content = raw.partition(b"\0")
+                return header.split(b" ", 1)[0].decode(), content
+            binary = bytes.fromhex(sha)
+            for pack in self._load_packs():
+                offset = pack.find(binary)
+                if offset is not None:
+                    kind, content = pack.read(offset, self)
+                    return OBJECT_TYPES[kind], content
+        result = self._batch.read(sha)
+        if result is None:
+            raise GitError(f"Object {sha} not found")
+        return result
+
+    def _shallow_commits(self) -> set[str]:
+        if self._shallow is None:
+            self._shallow = set((_read_text(self.common_dir / "shallow") or "").split())
+        return self._shallow
+
+    def read_commit(self, sha: str) -> dict:
+        """Parse a commit into hash, author, subject, parents and commit time."""
+        kind, content = self.read_object(sha)
+        if kind != "commit":
+            raise GitError(f"{sha} is a {kind}, not a commit")
+        headers, _, message = content.decode("utf-8", "replace").partition("\n\n")
+        parents = []
+        author = ""
+        timestamp = 0
+        for line in headers.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "parent":
+                parents.append(value)
+            elif key == "author":
+                author = value.rsplit(" <", 1)[0]
+            elif key == "committer":
+                timestamp = int(value.rsplit(" ", 2)[-2])
+        if sha in self._shallow_commits():
+            parents = []
+        subject = " ".join(line.strip() for line in message.split("\n\n", 1)[0].splitlines())
+        return {
+            "sha": sha,
+            "hash": sha[:7],
+            "author": author,
+            "message": subject,
+            "parents": parents,
+            "time": timestamp,
+        }
+
+    def iter_commits(self, start: str | None = None) -> Iterator[dict]:
+        """Walk history from `start` (default HEAD), newest commit first."""
+        import heapq
+
+        sha = start or self.head_sha()
+        if sha is None:
+            return
+        seen = {sha}
+        queue = [(0, 0, self.read_commit(sha))]
+        order = 1
+        while queue:
+            _, _, commit = heapq.heappop(queue)
+            yield commit
+            for parent in commit["parents"]:
+                if parent not in seen:
+                    seen.add(parent)
+                    parent_commit = self.read_commit(parent)
+                    heapq.heappush(queue, (-parent_commit["time"], order, parent_commit))
+                    order += 1
+
+    def read_blobs(self, specs: list[str]) -> Iterator[bytes | None]:
+        """Read many `rev:path` specs through the batch process, in order."""
+        for result in self._batch.read_many(specs):
+            yield result[1] if result and result[0] == "blob" else None
+
+    # Index
+
+    def index_path(self) -> Path:
+        """The index git would use: $GIT_INDEX_FILE (set for hooks) or .git/index."""
+        override = os.environ.get("GIT_INDEX_FILE")
+        return Path(override).resolve() if override else self.git_dir / "index"
+
+    @staticmethod
+    def _find_index_entry(data: bytes, path: str, hash_size: int = 20) -> str | None:
+        """Find the stage-0 blob SHA of `path` in a version 2/3 index.
+
+        Each entry is 40 bytes of stat data, the object id (`hash_size`
+        bytes: 20 for SHA-1, 32 for SHA-256), 2 bytes of flags
+        (stage and name length), 2 more flag bytes in v3 extended entries,
+        then the NUL-terminated name, so the entry is found by searching
+        for the name and checking the flags in front of it.
+        """
+        name = path.encode()
+        start = 12
+        while (pos := data.find(name + b"\0", start)) != -1:
+            start = pos + 1
+            for flags_at in (pos - 2, pos - 4):
+                if flags_at < 12 + 40 + hash_size:
+                    continue
+                flags = int.from_bytes(data[flags_at : flags_at + 2], "big")
+                extended = flags_at == pos - 4
+                if bool(flags & 0x4000) != extended or flags & 0x3000:
+                    continue
+                if (flags & 0x0FFF) == min(len(name), 0x0FFF):
+                    return data[flags_at - hash_size : flags_at].hex()
+        return None
+
+    def index_blobs(self, paths: list[str]) -> dict[str, bytes]:
+        """Staged (stage 0) content of repository-relative `paths`.
+
+        Entries are located in the raw index file and read with the object
+        reader, so nothing is spawned in the common case. Index versions or
+        layouts that cannot be searched this way (v4 path compression, split
+        and sparse indexes) fall back to one `git ls-files --stage` call.
+        Paths that are not staged are left out.
+        """
+        index_path = self.index_path()
+        try:
+            data = index_path.read_bytes()
+        except OSError:
+            data = b""
+        shas = {}
+        if data[:4] == b"DIRC" and int.from_bytes(data[4:8], "big") in (2, 3):
+            for path in paths:
+                sha = self._find_index_entry(data, path, self.hash_size)
+                if sha is not None:
+                    shas[path] = sha
+        missing = [path for path in paths if path not in shas]
+        if missing:
+            for record in self.run("ls-files", "--stage", "-z", "--", *missing).split("\0"):
+                info, _, path = record.partition("\t")
+                fields = info.split()
+                if path in missing and len(fields) == 3 and fields[2] == "0":
+                    shas[path] = fields[1]
+        return {path: self.read_object(sha)[1] for path, sha in shas.items()}
+
+    # Commands
+
+    def stream(self, *args: str, sep: str = "\n") -> Iterator[str]:
+        """Run `git <args>` and yield its output records as they arrive.
+
+        Output is read in fixed-size chunks, so memory stays constant no
+        matter how much the command prints.
+        """
+        import codecs
+        import subprocess
+
+        proc = subprocess.Popen(
+            ["git", "-C", str(self.root), *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        pending = ""
+        try:
+            for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                pending += decoder.decode(chunk)
+                *records, pending = pending.split(sep)
+                yield from records
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            error = proc.stderr.read().decode(errors="replace").strip()
+            proc.stderr.close()
+            proc.wait()
+        if proc.returncode:
+            raise GitError(error or f"git {args[0]} failed")
+
+    def run(self, *args: str) -> str:
+        """Run `git <args>` and return its output, for commands that print little.
+
+        Uses os.posix_spawnp where available, so short-lived callers such as
+        the pre-commit validator do not pay for importing subprocess.
+        """
+        argv = ["git", "-C", str(self.root), *args]
+        if not hasattr(os, "posix_spawnp"):
+            import subprocess
+
+            proc = subprocess.run(argv, capture_output=True)
+            out, err, code = proc.stdout, proc.stderr, proc.returncode
+        else:
+            out_r, out_w = os.pipe()
+            err_r, err_w = os.pipe()
+            try:
+                pid = os.posix_spawnp(
+                    "git",
+                    argv,
+                    os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_DUP2, out_w, 1),
+                        (os.POSIX_SPAWN_DUP2, err_w, 2),
+                    ],
+                )
+            finally:
+                os.close(out_w)
+                os.close(err_w)
+            with open(out_r, "rb") as f:
+                out = f.read()
+            with open(err_r, "rb") as f:
+                err = f.read()
+            code = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        if code:
+            message = err.decode(errors="replace").strip()
+            raise GitError(message or f"git {args[0]} failed")
+        return out.decode(errors="replace")
+
+    def status(self, *pathspecs: str) -> dict:
+        """Branch, upstream and changed paths from one `git status --porcelain=v2`.
+
+        `changes` maps repository-relative paths to their two-letter XY
+        state ("??" for untracked files). Runs with --no-optional-locks, so
+        git does not rewrite the index to refresh its stat data; callers
+        such as the daemon key cached results on the index file's stat.
+        """
+        result = {
+            "branch": None,
+            "oid": None,
+            "upstream": None,
+            "ahead": 0,
+            "behind": 0,
+            "changes": {},
+        }
+        output = self.run(
+            "--no-optional-locks",
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            "--untracked-files=all",
+            "--",
+            *pathspecs,
+        )
+        records = iter(output.split("\0"))
+        for record in records:
+            kind = record[:2]
+            if kind == "# ":
+                key, _, value = record[2:].partition(" ")
+                if key == "branch.oid":
+                    result["oid"] = None if value == "(initial)" else value
+                elif key == "branch.head":
+                    result["branch"] = "HEAD" if value == "(detached)" else value
+                elif key == "branch.upstream":
+                    result["upstream"] = value
+                elif key == "branch.ab":
+                    ahead, behind = value.split()
+                    result["ahead"], result["behind"] = int(ahead), -int(behind)
+            elif kind == "1 ":
+                fields = record.split(" ", 8)
+                result["changes"][fields[8]] = fields[1]
+            elif kind == "2 ":
+                fields = record.split(" ", 9)
+                result["changes"][fields[9]] = fields[1]
+                next(records, None)  # the rename source path
+            elif kind == "u ":
+                fields = record.split(" ", 10)
+                result["changes"][fields[10]] = fields[1]
+            elif kind == "? ":
+                result["changes"][record[2:]] = "??"
+        return result
+
+    def close(self) -> None:
+        """Release memory maps and stop the cat-file process, if any."""
+        self._batch.close()
+        for pack in self._packs or []:
+            pack.close()
+        self._packs = None
+
+
+def find_repos(target: Path) -> list[Path]:
+    """List git working trees under a directory, or named in a file (one per line)."""
+    if target.is_file():
+        return [
+            Path(line.strip()).expanduser()
+            for line in target.read_text().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+    repos = []
+    for dirpath, dirnames, _ in os.walk(target):
+        if ".git" in dirnames or os.path.isfile(os.path.join(dirpath, ".git")):
+            repos.append(Path(dirpath))
+            dirnames.clear()
+            continue
+        dirnames[:] = [
+            d for d in dirnames if not d.startswith(".") and d != "node_modules"
+        ]
+    return sorted(repos)
+
+
+@cache
+def open_repo() -> GitRepo:
+    """Return the repository for the working directory, or exit with an error."""
+    repo = GitRepo.discover()
+    if repo is None:
+        print("Error: Not in a git repository")
+        sys.exit(1)
+    atexit.register(repo.close)
+    return repo
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Pre-commit hook client for the BTB validator daemon.
+
+Sends one request to the daemon serving this repository (btb_daemon.py)
+and exits with its verdict. When no daemon is running it validates
+in-process, exactly like validate_progress.py.
+
+Only os, sys and the C-level _socket module are imported before the
+request is answered (socket.py alone pulls in enum and selectors), so the
+hook costs little more than interpreter startup.
+"""
+
+import _socket
+import os
+import sys
+
+SOCKET_NAME = "btb-validate.sock"
+# sockaddr_un.sun_path is 104-108 bytes depending on the platform
+MAX_SOCKET_PATH = 100
+
+
+def find_git_dir(start: str) -> str | None:
+    """Locate the git directory for `start` ($GIT_DIR wins, as in hooks)."""
+    if "GIT_DIR" in os.environ:
+        return os.path.abspath(os.environ["GIT_DIR"])
+    path = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            with open(dot_git) as f:
+                pointer = f.read().strip()
+            if pointer.startswith("gitdir:"):
+                return os.path.normpath(os.path.join(path, pointer[7:].strip()))
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def socket_path(git_dir: str) -> str:
+    """The daemon socket of a repository: .git/btb-validate.sock.
+
+    Paths too long for a unix socket use a per-user name in the
+    temporary directory instead.
+    """
+    path = os.path.join(git_dir, SOCKET_NAME)
+    if len(os.fsencode(path)) <= MAX_SOCKET_PATH:
+        return path
+    import hashlib
+    import tempfile
+
+    digest = hashlib.sha1(os.fsencode(git_dir)).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"btb-{os.getuid()}-{digest}.sock")
+
+
+def request(path: str, *fields: str, timeout: float = 30.0) -> tuple[int, str] | None:
+    """Send a NUL-separated request to the daemon and return (code, output).
+
+    Returns None when no daemon answers, so the caller can fall back.
+    """
+    if not hasattr(_socket, "AF_UNIX"):
+        return None
+    try:
+        conn = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    except OSError:
+        return None
+    try:
+        conn.settimeout(timeout)
+        conn.connect(path)
+        conn.sendall("\0".join(fields).encode())
+        conn.shutdown(_socket.SHUT_WR)
+        chunks = []
+        while chunk := conn.recv(65536):
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        conn.close()
+    code, sep, output = b"".join(chunks).decode(errors="replace").partition("\n")
+    if not sep or not code.lstrip("-").isdigit():
+        return None
+    return int(code), output
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Validate through the daemon, or in-process when it is not running.
+
+    Options (--packages, --worktree) are passed on to validate_progress.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    git_dir = find_git_dir(os.getcwd())
+    # Anything else (--help, typos) is left to validate_progress's argparse
+    if git_dir is not None and set(argv) <= {"--packages", "--worktree"}:
+        # git points hooks at a temporary index for `commit -a` / `commit <paths>`
+        index = os.environ.get("GIT_INDEX_FILE")
+        index = os.path.abspath(index) if index else ""
+        reply = request(socket_path(git_dir), "validate", index, *argv)
+        if reply is not None:
+            code, output = reply
+            sys.stdout.write(output)
+            sys.exit(code)
+
+    import validate_progress
+
+    validate_progress.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,147 +7,252 @@ Shows:
 - Document coverage (which BTB documents exist)
 - Recent commits by author type (HUMAN vs Claude)
 - Next recommended actions
+
+With --fleet, gathers the same status for every BTB repository under a
+directory (or listed in a file) on a process pool and prints one table.
 """
 
+import argparse
+import json
+import os
 import sys
+import time
+from itertools import islice, repeat
 from pathlib import Path
-import subprocess
-import re
-from datetime import datetime
+from datetime import date, datetime
+from collections.abc import Iterable, Iterator
+
+from btb_git import GitError, GitRepo, find_repos, open_repo, write_atomic
+from progress_doc import load_progress, parse_progress
+from specs_index import SPECS_INDEX_CACHE, SpecsIndex, load_specs_index
+
+STATUS_CACHE = "btb-status-cache.json"
+CACHE_VERSION = 3
 
 
-def find_repo_root() -> Path:
-    """Find the git repository root."""
+def get_recent_commits(repo: GitRepo, limit: int = 10) -> list[dict]:
+    """Get recent commits with author and message."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        print("Error: Not in a git repository")
-        sys.exit(1)
+        return [
+            {"hash": c["hash"], "author": c["author"], "message": c["message"]}
+            for c in islice(repo.iter_commits(), limit)
+        ]
+    except GitError:
+        return []
+
+
+def stream_commits(
+    repo: GitRepo, since: str | None = None, until: str | None = None
+) -> Iterator[dict]:
+    """Stream commits from `git log` one at a time, newest first."""
+    args = ["log", "--format=%h%x1f%an%x1f%at%x1f%s"]
+    if since:
+        args.append(f"--since={since}")
+    if until:
+        args.append(f"--until={until}")
+    for line in repo.stream(*args):
+        if line:
+            hash_, author, timestamp, message = line.split("\x1f", 3)
+            yield {
+                "hash": hash_,
+                "author": author,
+                "time": int(timestamp),
+                "message": message,
+            }
+
+
+def tally_commit(mix: dict[str, int], commit: dict) -> None:
+    """Add one commit to HUMAN/Claude/other counts."""
+    is_human = "HUMAN" in commit["message"]
+    is_claude = commit["author"] == "Claude"
+    mix["human"] += is_human
+    mix["claude"] += is_claude
+    mix["other"] += not (is_human or is_claude)
+
+
+def commit_mix(commits: Iterable[dict]) -> dict[str, int]:
+    """Count HUMAN, Claude and other commits."""
+    mix = {"human": 0, "claude": 0, "other": 0}
+    for commit in commits:
+        tally_commit(mix, commit)
+    return mix
+
+
+def weekly_histogram(commits: Iterable[dict]) -> dict[str, dict[str, int]]:
+    """Count HUMAN, Claude and other commits per ISO week in a single pass.
+
+    Memory grows with the number of weeks covered, not the number of commits.
+    """
+    weeks: dict[str, dict[str, int]] = {}
+    for commit in commits:
+        year, week, _ = date.fromtimestamp(commit["time"]).isocalendar()
+        key = f"{year}-W{week:02d}"
+        mix = weeks.get(key)
+        if mix is None:
+            mix = weeks[key] = {"human": 0, "claude": 0, "other": 0}
+        tally_commit(mix, commit)
+    return dict(sorted(weeks.items()))
+
+
+def check_documents(repo: GitRepo) -> dict[str, bool]:
+    """Check which BTB documents exist anywhere under SPECS/."""
+    return specs_index(repo).coverage()
+
+
+def specs_index(repo: GitRepo) -> SpecsIndex:
+    """Return the SPECS/ document index, refreshing its cache under .git/."""
+    return load_specs_index(repo.root / "SPECS", repo.git_dir / SPECS_INDEX_CACHE)
+
+
+def read_progress(progress_path: Path) -> dict | None:
+    """Read phase, report date and Next Steps completion from PROGRESS.md."""
+    doc = load_progress(progress_path)
+    if doc is None:
+        return None
+    return {
+        "phase": doc.phase or "Unknown",
+        "date": doc.report_date or "Unknown",
+        "next_steps": [doc.next_steps_done, len(doc.next_steps)],
+    }
 
 
-def get_current_branch() -> str:
-    """Get the current git branch name."""
+def _stat_key(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for a path, or None if it does not exist."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return "unknown"
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
 
-def get_recent_commits(limit: int = 10) -> list[dict]:
-    """Get recent commits with author and message."""
+def load_status_cache(repo: GitRepo) -> dict:
+    """Load the per-section status cache stored under .git/."""
     try:
-        result = subprocess.run(
-            ["git", "log", f"-{limit}", "--format=%h|%an|%s"],
-            capture_output=True,
-            text=True,
-            check=True,
+        cache = json.loads((repo.git_dir / STATUS_CACHE).read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("sections", {})
+
+
+def save_status_cache(repo: GitRepo, sections: dict) -> None:
+    """Atomically replace the status cache; a read-only .git/ is ignored."""
+    try:
+        write_atomic(
+            repo.git_dir / STATUS_CACHE,
+            json.dumps({"version": CACHE_VERSION, "sections": sections}),
         )
-        commits = []
-        for line in result.stdout.strip().split("\n"):
-            if "|" in line:
-                hash_, author, message = line.split("|", 2)
-                commits.append({"hash": hash_, "author": author, "message": message})
-        return commits
-    except subprocess.CalledProcessError:
-        return []
+    except OSError:
+        pass
 
 
-def extract_phase_from_progress(content: str) -> str:
-    """Extract current phase from PROGRESS.md."""
-    phase_pattern = r"\*\*Current Phase\*\*:\s*(.+)"
-    match = re.search(phase_pattern, content)
-    if match:
-        return match.group(1).strip()
-    return "Unknown"
+def compute_section(repo: GitRepo, name: str):
+    """Compute one status section: documents, progress or commits."""
+    specs_dir = repo.root / "SPECS"
+    if name == "documents":
+        return check_documents(repo)
+    if name == "progress":
+        return read_progress(specs_dir / "PROGRESS.md")
+    return get_recent_commits(repo, 10)
 
 
-def extract_date_from_progress(content: str) -> str:
-    """Extract report date from PROGRESS.md."""
-    date_pattern = r"\*\*Report Date\*\*:\s*(.+)"
-    match = re.search(date_pattern, content)
-    if match:
-        return match.group(1).strip()
-    return "Unknown"
+def collect_status(repo: GitRepo, use_cache: bool = True) -> dict:
+    """Gather the BTB status of a repository as JSON-serializable data.
 
+    Sections are cached under .git/ with the inputs they were computed from:
+    progress with the PROGRESS.md stat and commits with the HEAD SHA. Only
+    sections whose inputs changed are recomputed. Document coverage comes
+    from the SPECS/ index, which keeps its own per-directory cache.
+    """
+    specs_dir = repo.root / "SPECS"
+    try:
+        branch = repo.current_branch()
+    except GitError:
+        branch = "unknown"
+
+    status = {
+        "repository": str(repo.root),
+        "branch": branch,
+        "specs": specs_dir.is_dir(),
+        "documents": None,
+        "progress": None,
+        "commits": [],
+    }
+    if not status["specs"]:
+        return status
 
-def check_documents(specs_dir: Path) -> dict[str, bool]:
-    """Check which BTB documents exist."""
-    return {
-        "README.md": (specs_dir / "README.md").exists(),
-        "PROGRESS.md": (specs_dir / "PROGRESS.md").exists(),
-        "DESIGN": any(specs_dir.glob("*Design*.md"))
-        or any(specs_dir.glob("*DESIGN*.md")),
-        "MVP": any(specs_dir.glob("MVP*.md")) or any(specs_dir.glob("mvp*.md")),
+    cache = load_status_cache(repo) if use_cache else {}
+    sections = {}
+    try:
+        head = repo.head_sha()
+    except GitError:
+        head = None
+    status["documents"] = check_documents(repo)
+    keys = {
+        "progress": _stat_key(specs_dir / "PROGRESS.md"),
+        "commits": head,
     }
+    for name, key in keys.items():
+        entry = cache.get(name)
+        if entry and entry["key"] == key:
+            status[name] = entry["value"]
+        else:
+            status[name] = compute_section(repo, name)
+        sections[name] = {"key": key, "value": status[name]}
 
+    if use_cache and sections != cache:
+        save_status_cache(repo, sections)
+    return status
 
-def main():
-    """Display BTB status."""
-    repo_root = find_repo_root()
-    specs_dir = repo_root / "SPECS"
-    branch = get_current_branch()
+
+def print_status(status: dict) -> None:
+    """Print a single repository's status report."""
+    repo_root = Path(status["repository"])
+    docs = status["documents"]
+    today = datetime.now().strftime("%B %d, %Y")
 
     print("📊 BTB Workflow Status")
     print("=" * 60)
 
     # Repository info
     print(f"\n📁 Repository: {repo_root.name}")
-    print(f"🌿 Branch: {branch}")
+    print(f"🌿 Branch: {status['branch']}")
 
     # Document coverage
     print("\n📚 Documentation Coverage:")
-    if not specs_dir.exists():
+    if not status["specs"]:
         print("   ❌ SPECS/ directory not found")
         print("\n💡 Recommendation: Initialize BTB workflow")
         print("   Create SPECS/ directory and add README.md as entrypoint")
-        sys.exit(0)
+        return
 
-    docs = check_documents(specs_dir)
     for doc_name, exists in docs.items():
-        status = "✅" if exists else "❌"
-        print(f"   {status} {doc_name}")
+        status_icon = "✅" if exists else "❌"
+        print(f"   {status_icon} {doc_name}")
 
     # Progress report info
-    progress_path = specs_dir / "PROGRESS.md"
-    if progress_path.exists():
-        content = progress_path.read_text()
-        phase = extract_phase_from_progress(content)
-        date = extract_date_from_progress(content)
-
+    progress = status["progress"]
+    if progress:
         print(f"\n📈 Current Status:")
-        print(f"   Phase: {phase}")
-        print(f"   Last Updated: {date}")
+        print(f"   Phase: {progress['phase']}")
+        print(f"   Last Updated: {progress['date']}")
+        done, total = progress["next_steps"]
+        if total:
+            print(f"   Next Steps: {done}/{total} complete")
 
         # Check if update needed
-        today = datetime.now().strftime("%B %d, %Y")
-        if date != today:
+        if progress["date"] != today:
             print(f"   ⚠️  PROGRESS.md needs update (today is {today})")
 
     # Recent commit analysis
     print("\n📝 Recent Commit History:")
-    commits = get_recent_commits(10)
-
-    human_commits = [c for c in commits if "HUMAN" in c["message"]]
-    claude_commits = [c for c in commits if c["author"] == "Claude"]
-    other_commits = [
-        c for c in commits if c not in human_commits and c not in claude_commits
-    ]
+    commits = status["commits"]
+    mix = commit_mix(commits)
 
-    print(f"   HUMAN commits: {len(human_commits)} (design/requirements)")
-    print(f"   Claude commits: {len(claude_commits)} (implementation)")
-    print(f"   Other commits: {len(other_commits)}")
+    print(f"   HUMAN commits: {mix['human']} (design/requirements)")
+    print(f"   Claude commits: {mix['claude']} (implementation)")
+    print(f"   Other commits: {mix['other']}")
 
     if commits:
         print("\n   Last 5 commits:")
@@ -171,15 +276,370 @@ def main():
 
     if all([docs["README.md"], docs["PROGRESS.md"]]):
         print("   ✅ Core BTB structure is in place")
-        if progress_path.exists():
-            content = progress_path.read_text()
-            date = extract_date_from_progress(content)
-            today = datetime.now().strftime("%B %d, %Y")
-            if date != today:
-                print("   ⚠️  Update PROGRESS.md before next commit")
+        if progress and progress["date"] != today:
+            print("   ⚠️  Update PROGRESS.md before next commit")
+
+    print("\n" + "=" * 60)
+
+
+def print_history(
+    repo: GitRepo, since: str | None = None, until: str | None = None
+) -> None:
+    """Print per-week HUMAN/Claude/other commit counts for a time window."""
+    try:
+        weeks = weekly_histogram(stream_commits(repo, since, until))
+    except GitError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
+    window = " ".join(
+        part
+        for part in (since and f"since {since}", until and f"until {until}")
+        if part
+    )
+    print("📅 BTB Commit History by Week" + (f" ({window})" if window else ""))
+    print("=" * 60)
+    if not weeks:
+        print("\n   No commits in this window")
+        return
+
+    total = {"human": 0, "claude": 0, "other": 0}
+    peak = max(sum(mix.values()) for mix in weeks.values())
+    print(f"\n   {'Week':<10} {'HUMAN':>6} {'Claude':>7} {'Other':>6}")
+    for week, mix in weeks.items():
+        for kind, count in mix.items():
+            total[kind] += count
+        bar = "#" * max(1, round(30 * sum(mix.values()) / peak))
+        print(
+            f"   {week:<10} {mix['human']:>6} {mix['claude']:>7} "
+            f"{mix['other']:>6}  {bar}"
+        )
+    print(
+        f"   {'Total':<10} {total['human']:>6} {total['claude']:>7} {total['other']:>6}"
+    )
     print("\n" + "=" * 60)
 
 
+def watch_inputs(repo: GitRepo, head_ref: str | None) -> dict[str, list]:
+    """Stat (without reading) the files each status section depends on.
+
+    SPECS/ directories are only re-listed when their mtime changed.
+    """
+    specs_dir = repo.root / "SPECS"
+    head = _stat_key(repo.git_dir / "HEAD")
+    refs = [head, _stat_key(repo.common_dir / "packed-refs")]
+    if head_ref:
+        refs.append(_stat_key(repo.common_dir / head_ref))
+    return {
+        "branch": [head],
+        "documents": specs_index(repo).fingerprint() if specs_dir.is_dir() else None,
+        "progress": [_stat_key(specs_dir / "PROGRESS.md")],
+        "commits": refs,
+    }
+
+
+def watch_status(
+    repo: GitRepo, interval: float, json_path: str | None, use_cache: bool = True
+) -> None:
+    """Poll the status inputs and refresh only the sections that changed.
+
+    Redraws the report in place, and with a JSON path emits one JSON event
+    per line: a full "status" event first, then "update" events carrying
+    only the changed sections.
+    """
+    events = None
+    if json_path == "-":
+        events = sys.stdout
+    elif json_path:
+        events = open(json_path, "a")
+
+    def emit(event: dict) -> None:
+        if events is not None:
+            events.write(json.dumps(event) + "\n")
+            events.flush()
+        if json_path != "-":
+            print("\033[H\033[2J", end="")
+            print_status(status)
+            print(f"\n👀 Watching every {interval:g}s (Ctrl-C to stop)", flush=True)
+
+    status = collect_status(repo, use_cache)
+    head_ref = repo.head_ref()
+    inputs = watch_inputs(repo, head_ref)
+    emit({"event": "status", "time": time.time(), "status": status})
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = watch_inputs(repo, head_ref)
+            changed = [name for name in current if current[name] != inputs[name]]
+            if not changed:
+                continue
+            if "branch" in changed:
+                head_ref = repo.head_ref()
+                current = watch_inputs(repo, head_ref)
+            inputs = current
+
+            if (repo.root / "SPECS").is_dir() != status["specs"]:
+                status = collect_status(repo, use_cache)
+                update = status
+            else:
+                update = {}
+                if "branch" in changed:
+                    update["branch"] = status["branch"] = repo.current_branch()
+                if status["specs"]:
+                    for name in ("documents", "progress", "commits"):
+                        if name in changed:
+                            update[name] = status[name] = compute_section(repo, name)
+            emit({"event": "update", "time": time.time(), "sections": update})
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if events is not None and events is not sys.stdout:
+            events.close()
+
+
+def progress_timeline(repo: GitRepo) -> list[dict]:
+    """Header fields and Next Steps completion at every PROGRESS.md revision.
+
+    Revisions come from one `git log` stream and their blobs from one
+    `git cat-file --batch` pipe, oldest revision first.
+    """
+    revisions = [
+        line.split("\x1f")
+        for line in repo.stream(
+            "log", "--reverse", "--format=%H%x1f%at", "--", "SPECS/PROGRESS.md"
+        )
+        if line
+    ]
+    blobs = repo.read_blobs([f"{sha}:SPECS/PROGRESS.md" for sha, _ in revisions])
+    timeline = []
+    for (sha, timestamp), blob in zip(revisions, blobs):
+        entry = {"hash": sha[:7], "time": int(timestamp), "deleted": blob is None}
+        if blob is not None:
+            doc = parse_progress(blob.decode("utf-8", "replace"))
+            entry.update(
+                phase=doc.phase or "Unknown",
+                date=doc.report_date or "Unknown",
+                next_steps=[doc.next_steps_done, len(doc.next_steps)],
+            )
+        timeline.append(entry)
+    return timeline
+
+
+def print_timeline(timeline: list[dict]) -> None:
+    """Print PROGRESS.md revisions, marking the fields that changed."""
+    print("🕰️  PROGRESS.md Timeline")
+    print("=" * 60)
+    if not timeline:
+        print("\n   No commits touch SPECS/PROGRESS.md")
+        return
+
+    previous = {}
+    for entry in timeline:
+        committed = datetime.fromtimestamp(entry["time"]).strftime("%Y-%m-%d")
+        if entry["deleted"]:
+            print(f"\n{entry['hash']} {committed}  (PROGRESS.md deleted)")
+            previous = {}
+            continue
+        done, total = entry["next_steps"]
+        fields = {
+            "Phase": entry["phase"],
+            "Report Date": entry["date"],
+            "Next Steps": f"{done}/{total}",
+        }
+        changes = [
+            f"{name}: {value}"
+            for name, value in fields.items()
+            if previous.get(name) != value
+        ]
+        print(
+            f"\n{entry['hash']} {committed}  " + ("; ".join(changes) or "(no change)")
+        )
+        previous = fields
+    print(f"\n{len(timeline)} revisions")
+    print("\n" + "=" * 60)
+
+
+def find_fleet_repos(target: Path) -> list[Path]:
+    """List BTB repositories under a directory, or named in a file (one per line)."""
+    return [repo for repo in find_repos(target) if (repo / "SPECS").is_dir()]
+
+
+def fleet_status(repo_root: Path, use_cache: bool = True) -> dict:
+    """Collect status for one fleet repository (runs in a worker process)."""
+    repo = GitRepo.discover(repo_root)
+    if repo is None:
+        return {"repository": str(repo_root), "error": "not a git repository"}
+    try:
+        return collect_status(repo, use_cache)
+    except (GitError, OSError) as e:
+        return {"repository": str(repo_root), "error": str(e)}
+    finally:
+        repo.close()
+
+
+def print_fleet_table(statuses: list[dict]) -> None:
+    """Print one aggregated table for a fleet of repositories."""
+    today = datetime.now().strftime("%B %d, %Y")
+    rows = [("Repository", "Branch", "Docs", "Phase", "Updated", "H/C/O")]
+    stale = 0
+    for status in statuses:
+        name = Path(status["repository"]).name
+        if "error" in status:
+            rows.append((name, "-", "-", f"error: {status['error']}", "-", "-"))
+            continue
+        docs = status["documents"] or {}
+        progress = status["progress"] or {"phase": "-", "date": "-"}
+        mix = commit_mix(status["commits"])
+        if progress["date"] != today:
+            stale += 1
+        rows.append(
+            (
+                name,
+                status["branch"],
+                "".join(doc[0] if exists else "·" for doc, exists in docs.items()),
+                progress["phase"][:30],
+                progress["date"],
+                f"{mix['human']}/{mix['claude']}/{mix['other']}",
+            )
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    print("📊 BTB Fleet Status")
+    for i, row in enumerate(rows):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if i == 0:
+            print("  ".join("-" * width for width in widths))
+    print(f"\n{len(statuses)} repositories, {stale} with PROGRESS.md not updated today")
+
+
+def run_fleet(
+    target: Path, json_path: str | None, jobs: int | None, use_cache: bool = True
+) -> None:
+    """Gather status across many repositories in parallel."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    repos = find_fleet_repos(target)
+    if not repos:
+        print(f"No BTB repositories (git repos with SPECS/) found in {target}")
+        sys.exit(1)
+
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(repos) // (workers * 4))
+        statuses = list(
+            pool.map(fleet_status, repos, repeat(use_cache), chunksize=chunksize)
+        )
+
+    if json_path != "-":
+        print_fleet_table(statuses)
+    if json_path:
+        write_json(json_path, statuses)
+
+
+def write_json(json_path: str, data) -> None:
+    """Write report data as JSON to a file, or to stdout for '-'."""
+    if json_path == "-":
+        json.dump(data, sys.stdout, indent=2)
+        print()
+        return
+    Path(json_path).write_text(json.dumps(data, indent=2) + "\n")
+    print(f"JSON written to {json_path}")
+
+
+def main(argv: list[str] | None = None):
+    """Display BTB status."""
+    parser = argparse.ArgumentParser(description="Display BTB workflow status")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute everything instead of using the status cache in .git/",
+    )
+    window = parser.add_argument_group("commit history by week")
+    window.add_argument(
+        "--since", metavar="DATE", help="Count commits newer than DATE (any git date)"
+    )
+    window.add_argument(
+        "--until", metavar="DATE", help="Count commits older than DATE (any git date)"
+    )
+    window.add_argument(
+        "--all", action="store_true", help="Count commits across the full history"
+    )
+    parser.add_argument(
+        "--timeline",
+        action="store_true",
+        help=(
+            "Show how phase, report date and Next Steps changed "
+            "across PROGRESS.md history"
+        ),
+    )
+    parser.add_argument(
+        "--fleet",
+        metavar="DIR|LIST",
+        type=Path,
+        help="Report on every BTB repository under DIR or listed in a file",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help=(
+            "With --fleet or --timeline, also write the report as JSON; with"
+            " --watch, append one JSON event per line ('-' for stdout only)"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and refresh the report when git or SPECS/ change",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="With --watch, polling interval (default: 1)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="With --fleet, number of worker processes (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs and not args.fleet:
+        parser.error("--jobs requires --fleet")
+    if args.json and not (args.fleet or args.watch or args.timeline):
+        parser.error("--json requires --fleet, --watch or --timeline")
+
+    if args.all and (args.since or args.until):
+        parser.error("--all cannot be combined with --since/--until")
+
+    if args.all or args.since or args.until:
+        print_history(open_repo(), args.since, args.until)
+        return
+
+    if args.timeline:
+        try:
+            timeline = progress_timeline(open_repo())
+        except GitError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if args.json != "-":
+            print_timeline(timeline)
+        if args.json:
+            write_json(args.json, timeline)
+        return
+
+    if args.watch:
+        watch_status(open_repo(), args.interval, args.json, not args.no_cache)
+        return
+
+    if args.fleet:
+        run_fleet(args.fleet, args.json, args.jobs, not args.no_cache)
+        return
+
+    print_status(collect_status(open_repo(), use_cache=not args.no_cache))
+
+
 if __name__ == "__main__":
     main()
@@ -7,55 +7,26 @@ Creates:
 - SPECS/README.md (navigation entrypoint)
 - SPECS/PROGRESS.md (status tracking template)
 - Template sections for easy customization
+
+With --all DIR, initializes every git repository under DIR (or listed in
+a file) concurrently and prints a per-repository summary. Templates are
+rendered once per run and specialized per repository, and every file is
+written to a temporary name and renamed into place.
 """
 
-import sys
+import hashlib
+import os
 from pathlib import Path
-import subprocess
 from datetime import datetime
 import argparse
 
+from btb_git import GitError, GitRepo, find_repos, open_repo, write_atomic
+from progress_doc import load_progress
+from specs_index import SPECS_INDEX_CACHE, load_specs_index
 
-def find_repo_root() -> Path:
-    """Find the git repository root."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        print("Error: Not in a git repository")
-        sys.exit(1)
-
-
-def get_current_branch() -> str:
-    """Get the current git branch name."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return "main"
-
-
-def get_repo_name() -> str:
-    """Get repository name from git."""
-    repo_root = find_repo_root()
-    return repo_root.name
-
-
-def create_readme_template(project_name: str) -> str:
-    """Generate README.md template."""
-    return f"""# {project_name} - Documentation Guide
+README_TEMPLATE = """# {project_name} - Documentation Guide
 
-**Last Updated**: {datetime.now().strftime("%B %d, %Y")}
+**Last Updated**: {today}
 
 ---
 
@@ -122,17 +93,7 @@ Add additional documents as needed:
 **Ready to contribute?** Start with `PROGRESS.md` to see what's next!
 """
 
-
-def create_progress_template(project_name: str, branch: str) -> str:
-    """Generate PROGRESS.md template."""
-    today = datetime.now().strftime("%B %d, %Y")
-
-    # Try to detect session ID from branch if on claude/ branch
-    session_line = ""
-    if branch.startswith("claude/"):
-        session_line = f"**Session**: {branch}\n"
-
-    return f"""# {project_name} - Progress Report
+PROGRESS_TEMPLATE = """# {project_name} - Progress Report
 
 **Report Date**: {today}
 {session_line}**Branch**: `{branch}`
@@ -239,52 +200,359 @@ def create_progress_template(project_name: str, branch: str) -> str:
 **End of Progress Report**
 """
 
+TEMPLATES = {"README.md": README_TEMPLATE, "PROGRESS.md": PROGRESS_TEMPLATE}
+
+
+def render_templates() -> dict[str, str]:
+    """Render the parts shared by every repository (the date) once."""
+    today = datetime.now().strftime("%B %d, %Y")
+    return {
+        name: template.replace("{today}", today) for name, template in TEMPLATES.items()
+    }
+
+
+def specialize(
+    templates: dict[str, str], project_name: str, branch: str
+) -> dict[str, str]:
+    """Fill in the repository-specific fields of rendered templates."""
+    # Try to detect session ID from branch if on claude/ branch
+    session_line = f"**Session**: {branch}\n" if branch.startswith("claude/") else ""
+    fields = {
+        "project_name": project_name,
+        "branch": branch,
+        "session_line": session_line,
+    }
+    return {name: template.format_map(fields) for name, template in templates.items()}
+
+
+def create_readme_template(project_name: str) -> str:
+    """Generate README.md template."""
+    return specialize(render_templates(), project_name, "")["README.md"]
+
 
-def main():
+def create_progress_template(project_name: str, branch: str) -> str:
+    """Generate PROGRESS.md template."""
+    return specialize(render_templates(), project_name, branch)["PROGRESS.md"]
+
+
+def split_sections(text: str) -> tuple[list[str], list[tuple[str, list[str]]]]:
+    """Split markdown into the lines before the first `## ` heading and
+    (title, lines) blocks, one per `## ` section (code fences respected)."""
+    preamble: list[str] = []
+    sections: list[tuple[str, list[str]]] = []
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            sections.append((line[3:].strip(), [line]))
+        elif sections:
+            sections[-1][1].append(line)
+        else:
+            preamble.append(line)
+    return preamble, sections
+
+
+def merge_sections(existing: str, template: str) -> tuple[str, list[str]]:
+    """Add the template's `## ` sections missing from `existing`.
+
+    Each missing section goes after the existing section that precedes it
+    in the template; everything already in the file is kept as it is.
+    Returns the merged text and the titles that were added.
+    """
+    preamble, sections = split_sections(existing)
+    present = {title.lower() for title, _ in sections}
+    # Missing template sections, keyed by the present section they follow
+    inserts: dict[str | None, list[list[str]]] = {}
+    anchor = None
+    added = []
+    for title, lines in split_sections(template)[1]:
+        if title.lower() in present:
+            anchor = title.lower()
+        else:
+            inserts.setdefault(anchor, []).append(lines)
+            added.append(title)
+    if not added:
+        return existing, []
+
+    def block(lines: list[str]) -> str:
+        text = "".join(lines)
+        return text if text.endswith("\n") else text + "\n"
+
+    parts = ["".join(preamble)]
+    if parts[0] and not parts[0].endswith("\n"):
+        parts[0] += "\n"
+    parts.extend(block(lines) for lines in inserts.get(None, []))
+    for title, lines in sections:
+        parts.append(block(lines))
+        parts.extend(block(extra) for extra in inserts.get(title.lower(), []))
+    return "".join(parts), added
+
+
+def same_content(path: Path, data: bytes) -> bool:
+    """Whether a file already holds `data` (sizes first, then SHA-256 digests)."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return (
+            hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest()
+        )
+    except OSError:
+        return False
+
+
+def plan_file(
+    path: Path, content: str, force: bool, merge: bool
+) -> tuple[str, str | None, list[str]]:
+    """Decide what to do with one file.
+
+    Returns the action ("created", "overwrote", "merged", "unchanged" or
+    "kept"), the content to write (None for no write) and the merged
+    section titles.
+    """
+    if not path.exists():
+        return "created", content, []
+    if merge and path.name == "PROGRESS.md":
+        merged, added = merge_sections(path.read_text(), content)
+        return ("merged", merged, added) if added else ("unchanged", None, [])
+    if not force:
+        return "kept", None, []
+    if same_content(path, content.encode()):
+        return "unchanged", None, []
+    return "overwrote", content, []
+
+
+def init_repo(
+    repo_root: Path,
+    branch: str,
+    templates: dict[str, str],
+    force: bool = False,
+    merge: bool = False,
+    dry_run: bool = False,
+) -> dict:
+    """Create SPECS/ and its templates in one repository.
+
+    Returns what happened to each file ("created", "overwrote", "merged",
+    "unchanged" or "kept"). Files whose content would not change are not
+    rewritten, so their mtimes stay put. With `dry_run` nothing is written
+    and unified diffs of the planned changes are returned instead.
+    """
+    specs_dir = repo_root / "SPECS"
+    result = {
+        "repository": str(repo_root),
+        "specs_created": not specs_dir.exists(),
+        "files": {},
+        "merged_sections": [],
+        "diffs": [],
+    }
+    if not dry_run:
+        specs_dir.mkdir(exist_ok=True)
+    rendered = specialize(templates, repo_root.name, branch)
+    for name, content in rendered.items():
+        path = specs_dir / name
+        action, new_content, added = plan_file(path, content, force, merge)
+        result["files"][name] = action
+        result["merged_sections"].extend(added)
+        if new_content is None:
+            continue
+        if dry_run:
+            import difflib
+
+            old = (
+                path.read_text().splitlines(keepends=True)
+                if action != "created"
+                else []
+            )
+            rel = f"{repo_root.name}/SPECS/{name}"
+            diff = difflib.unified_diff(
+                old,
+                new_content.splitlines(keepends=True),
+                "/dev/null" if action == "created" else f"a/{rel}",
+                f"b/{rel}",
+            )
+            result["diffs"].append("".join(diff))
+        else:
+            write_atomic(path, new_content)
+    return result
+
+
+def init_one(repo_root: Path, templates: dict[str, str], options: dict) -> dict:
+    """Initialize one repository of an --all run, capturing errors."""
+    repo = GitRepo.discover(repo_root)
+    if repo is None or repo.root != repo_root.resolve():
+        return {"repository": str(repo_root), "error": "not a git repository"}
+    try:
+        return init_repo(repo.root, repo.current_branch(), templates, **options)
+    except (GitError, OSError) as e:
+        return {"repository": str(repo_root), "error": str(e)}
+    finally:
+        repo.close()
+
+
+def init_all(target: Path, jobs: int | None, **options) -> int:
+    """Initialize BTB in every repository under `target`; returns the exit code.
+
+    `options` are passed to init_repo (force, merge, dry_run).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    repos = find_repos(target)
+    if not repos:
+        print(f"No git repositories found in {target}")
+        return 1
+
+    templates = render_templates()
+    with ThreadPoolExecutor(
+        max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)
+    ) as pool:
+        results = list(pool.map(lambda root: init_one(root, templates, options), repos))
+
+    if options.get("dry_run"):
+        for result in results:
+            for diff in result.get("diffs", []):
+                print(diff, end="" if diff.endswith("\n") else "\n")
+        print(f"🔍 Dry run: {len(repos)} repositories, nothing written\n")
+    else:
+        print(f"🚀 Initialized BTB workflow in {len(repos)} repositories\n")
+    width = max(len(Path(r["repository"]).name) for r in results)
+    counts = {"initialized": 0, "unchanged": 0, "failed": 0}
+    for result in results:
+        name = Path(result["repository"]).name
+        if "error" in result:
+            counts["failed"] += 1
+            print(f"   ❌ {name:<{width}}  {result['error']}")
+            continue
+        actions = result["files"]
+        changed = any(
+            action not in ("kept", "unchanged") for action in actions.values()
+        )
+        counts["initialized" if changed else "unchanged"] += 1
+        summary = "  ".join(f"{file} {action}" for file, action in actions.items())
+        print(f"   {'✅' if changed else 'ℹ️ '} {name:<{width}}  {summary}")
+
+    print(
+        f"\n{counts['initialized']} "
+        f"{'to change' if options.get('dry_run') else 'initialized'}, "
+        f"{counts['unchanged']} unchanged, {counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+def main(argv: list[str] | None = None):
     """Initialize BTB structure."""
     parser = argparse.ArgumentParser(
         description="Initialize BTB workflow in repository"
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--force",
         action="store_true",
-        help="Overwrite existing files",
+        help="Overwrite existing files (files that would not change are left alone)",
+    )
+    mode.add_argument(
+        "--merge",
+        action="store_true",
+        help=(
+            "Add the template sections missing from an existing PROGRESS.md, "
+            "keeping the rest"
+        ),
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print a unified diff of the changes instead of writing them",
+    )
+    parser.add_argument(
+        "--all",
+        metavar="DIR",
+        type=Path,
+        help=(
+            "Initialize every git repository under DIR "
+            "(or listed in a file, one per line)"
+        ),
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help=(
+            "Repositories to initialize at once with --all "
+            "(default: CPU count + 4, at most 32)"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.all is None:
+        parser.error("--jobs requires --all")
+
+    if args.all is not None:
+        raise SystemExit(
+            init_all(
+                args.all,
+                args.jobs,
+                force=args.force,
+                merge=args.merge,
+                dry_run=args.dry_run,
+            )
+        )
 
-    repo_root = find_repo_root()
+    repo = open_repo()
+    repo_root = repo.root
     specs_dir = repo_root / "SPECS"
-    branch = get_current_branch()
-    project_name = get_repo_name()
+    branch = repo.current_branch()
+    project_name = repo_root.name
 
     print(f"🚀 Initializing BTB workflow for: {project_name}")
     print(f"   Repository: {repo_root}")
     print(f"   Branch: {branch}\n")
 
-    # Create SPECS directory
-    if not specs_dir.exists():
-        specs_dir.mkdir()
+    if specs_dir.exists():
+        index = load_specs_index(specs_dir, repo.git_dir / SPECS_INDEX_CACHE)
+
+    result = init_repo(
+        repo_root, branch, render_templates(), args.force, args.merge, args.dry_run
+    )
+
+    if args.dry_run:
+        for diff in result["diffs"]:
+            print(diff, end="" if diff.endswith("\n") else "\n")
+        summary = ", ".join(
+            f"{name} {action}" for name, action in result["files"].items()
+        )
+        print(f"🔍 Dry run, nothing written: {summary}")
+        return
+
+    # Report SPECS directory
+    if result["specs_created"]:
         print("✅ Created SPECS/ directory")
     else:
         print("ℹ️  SPECS/ directory already exists")
-
-    # Create README.md
-    readme_path = specs_dir / "README.md"
-    if readme_path.exists() and not args.force:
-        print("⚠️  SPECS/README.md already exists (use --force to overwrite)")
-    else:
-        readme_path.write_text(create_readme_template(project_name))
-        action = "Overwrote" if readme_path.exists() else "Created"
-        print(f"✅ {action} SPECS/README.md")
-
-    # Create PROGRESS.md
-    progress_path = specs_dir / "PROGRESS.md"
-    if progress_path.exists() and not args.force:
-        print("⚠️  SPECS/PROGRESS.md already exists (use --force to overwrite)")
-    else:
-        progress_path.write_text(create_progress_template(project_name, branch))
-        action = "Overwrote" if progress_path.exists() else "Created"
-        print(f"✅ {action} SPECS/PROGRESS.md")
+        for kind in ("DESIGN", "MVP"):
+            found = index.documents[kind]
+            if found:
+                print(
+                    f"ℹ️  Found {len(found)} {kind} document(s): "
+                    f"{', '.join(found[:3])}"
+                )
+
+    # Report README.md and PROGRESS.md
+    for name, action in result["files"].items():
+        if action == "merged":
+            added = ", ".join(result["merged_sections"])
+            print(f"✅ Merged missing sections into SPECS/{name}: {added}")
+            continue
+        if action == "unchanged":
+            print(f"ℹ️  SPECS/{name} is already up to date (not rewritten)")
+            continue
+        if action != "kept":
+            print(f"✅ {action.capitalize()} SPECS/{name}")
+            continue
+        print(f"⚠️  SPECS/{name} already exists (use --force to overwrite)")
+        if name == "PROGRESS.md":
+            existing = load_progress(specs_dir / name, header_only=True)
+            print(
+                f"   Current Phase: {existing.phase or 'Unknown'}, "
+                f"Report Date: {existing.report_date or 'Unknown'}"
+            )
 
     print("\n✅ BTB workflow initialized successfully!")
     print("\nNext steps:")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Single-pass PROGRESS.md parser shared by the BTB scripts.
+
+Parses the header fields (Report Date, Session, Branch, Current Phase),
+the section headings and the task checkboxes in one pass over the file.
+Header-only reads collect just the fields and stop as soon as all of them
+have been seen, and parsed documents are memoized on the file's mtime and
+size.
+"""
+
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+HEADER_FIELDS = ("Report Date", "Session", "Branch", "Current Phase")
+FIELD_PATTERN = re.compile(r"\*\*(Report Date|Session|Branch|Current Phase)\*\*:\s*(.+)")
+HEADING_PATTERN = re.compile(r"(#{1,6})\s+(.*?)\s*#*\s*$")
+CHECKBOX_PATTERN = re.compile(r"\s*[-*+]\s+\[([ xX])\]\s+(.*)")
+
+
+class Checkbox:
+    """A `- [ ]` / `- [x]` task item."""
+
+    __slots__ = ("text", "done", "line")
+
+    def __init__(self, text: str, done: bool, line: int):
+        self.text = text
+        self.done = done
+        self.line = line
+
+
+class Section:
+    """A markdown heading and the checkboxes directly under it."""
+
+    __slots__ = ("title", "level", "line", "checkboxes")
+
+    def __init__(self, title: str, level: int, line: int):
+        self.title = title
+        self.level = level
+        self.line = line
+        self.checkboxes: list[Checkbox] = []
+
+
+class ProgressDocument:
+    """Structured view of a PROGRESS.md file."""
+
+    def __init__(self):
+        self.fields: dict[str, str] = {}
+        self.sections: list[Section] = []
+        self.next_steps: list[Checkbox] = []
+        self.complete = True
+
+    @property
+    def report_date(self) -> str | None:
+        return self.fields.get("Report Date")
+
+    @property
+    def session(self) -> str | None:
+        return self.fields.get("Session")
+
+    @property
+    def phase(self) -> str | None:
+        return self.fields.get("Current Phase")
+
+    @property
+    def branch(self) -> str | None:
+        """The branch name inside the backticks of the Branch field."""
+        match = re.search(r"`(.+?)`", self.fields.get("Branch", ""))
+        return match.group(1).strip() if match else None
+
+    @property
+    def next_steps_done(self) -> int:
+        return sum(box.done for box in self.next_steps)
+
+    def section(self, title: str) -> Section | None:
+        """Return the first section whose title starts with `title`."""
+        for section in self.sections:
+            if section.title.startswith(title):
+                return section
+        return None
+
+
+def parse_lines(lines: Iterable[str], header_only: bool = False) -> ProgressDocument:
+    """Parse PROGRESS.md lines in a single pass.
+
+    With `header_only`, skips headings and checkboxes, stops as soon as
+    every header field has been seen (fields may appear after a section),
+    and marks the document incomplete.
+    """
+    doc = ProgressDocument()
+    current = None
+    in_next_steps = False
+    in_fence = False
+
+    for number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        if header_only:
+            if "**" in line:
+                match = FIELD_PATTERN.search(line)
+                if match and match.group(1) not in doc.fields:
+                    doc.fields[match.group(1)] = match.group(2).strip()
+                    if len(doc.fields) == len(HEADER_FIELDS):
+                        break
+            continue
+
+        if line.startswith("#"):
+            match = HEADING_PATTERN.match(line)
+            if match:
+                level = len(match.group(1))
+                current = Section(match.group(2), level, number)
+                doc.sections.append(current)
+                if level <= 2:
+                    in_next_steps = current.title.startswith("Next Steps")
+                continue
+
+        if "**" in line:
+            match = FIELD_PATTERN.search(line)
+            if match and match.group(1) not in doc.fields:
+                doc.fields[match.group(1)] = match.group(2).strip()
+                continue
+
+        if "[" in line:
+            match = CHECKBOX_PATTERN.match(line)
+            if match:
+                box = Checkbox(match.group(2).strip(), match.group(1) != " ", number)
+                if current is not None:
+                    current.checkboxes.append(box)
+                if in_next_steps:
+                    doc.next_steps.append(box)
+
+    doc.complete = not header_only
+    return doc
+
+
+def parse_progress(text: str) -> ProgressDocument:
+    """Parse PROGRESS.md content held in memory (e.g. a git blob)."""
+    return parse_lines(text.splitlines())
+
+
+_memo: dict[str, tuple[tuple[int, int], ProgressDocument]] = {}
+
+
+def load_progress(path: Path, header_only: bool = False) -> ProgressDocument | None:
+    """Read and parse PROGRESS.md once, memoized on its mtime and size.
+
+    Returns None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _memo.get(str(path))
+    if cached and cached[0] == key and (header_only or cached[1].complete):
+        return cached[1]
+
+    with open(path, encoding="utf-8") as f:
+        doc = parse_lines(f, header_only)
+    _memo[str(path)] = (key, doc)
+    return doc
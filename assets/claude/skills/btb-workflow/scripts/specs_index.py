@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Indexed discovery of BTB documents under SPECS/.
+
+Walks SPECS/ recursively with os.scandir and classifies markdown files
+case-insensitively as README.md, PROGRESS.md (top level only), DESIGN
+(name contains "design") or MVP (name starts with "mvp"). The listing of
+every directory is cached with its mtime, so a repeat query only stats the
+directories and re-lists the ones whose entries changed.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from btb_git import write_atomic
+
+DOCUMENT_KINDS = ("README.md", "PROGRESS.md", "DESIGN", "MVP")
+INDEX_VERSION = 1
+SPECS_INDEX_CACHE = "btb-specs-index.json"
+
+
+def classify(name: str, top_level: bool) -> str | None:
+    """Return the BTB document kind of a file name, or None."""
+    lower = name.lower()
+    if not lower.endswith(".md"):
+        return None
+    if top_level and lower in ("readme.md", "progress.md"):
+        return "README.md" if lower == "readme.md" else "PROGRESS.md"
+    if "design" in lower:
+        return "DESIGN"
+    if lower.startswith("mvp"):
+        return "MVP"
+    return None
+
+
+class SpecsIndex:
+    """Classified BTB documents and the per-directory listings they came from."""
+
+    def __init__(self, specs_dir: Path):
+        self.specs_dir = specs_dir
+        self.documents: dict[str, list[str]] = {kind: [] for kind in DOCUMENT_KINDS}
+        self.dirs: dict[str, list] = {}
+        self.changed = False
+
+    def coverage(self) -> dict[str, bool]:
+        """Which BTB document kinds exist."""
+        return {kind: bool(self.documents.get(kind)) for kind in DOCUMENT_KINDS}
+
+    def find(self, kind: str) -> list[Path]:
+        """Full paths of every document of a kind."""
+        return [self.specs_dir / rel for rel in self.documents.get(kind, [])]
+
+    def fingerprint(self) -> list:
+        """The mtimes of every indexed directory, for use as a cache key."""
+        return sorted([rel, entry[0]] for rel, entry in self.dirs.items())
+
+
+def scan_specs(specs_dir: Path, previous: dict[str, list] | None = None) -> SpecsIndex:
+    """Index SPECS/, re-listing only directories whose mtime changed.
+
+    `previous` maps directory paths (relative to SPECS/) to
+    [mtime_ns, markdown file names, subdirectory names].
+    """
+    previous = previous or {}
+    index = SpecsIndex(specs_dir)
+    pending = [""]
+    while pending:
+        rel = pending.pop()
+        path = specs_dir / rel if rel else specs_dir
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            index.changed = True
+            continue
+        entry = previous.get(rel)
+        if entry is None or entry[0] != mtime:
+            files, subdirs = [], []
+            try:
+                with os.scandir(path) as it:
+                    for item in it:
+                        if item.name.startswith("."):
+                            continue
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(item.name)
+                        elif item.name.lower().endswith(".md"):
+                            files.append(item.name)
+            except OSError:
+                continue
+            entry = [mtime, sorted(files), sorted(subdirs)]
+            index.changed = True
+        index.dirs[rel] = entry
+
+        for name in entry[1]:
+            kind = classify(name, top_level=not rel)
+            if kind:
+                index.documents[kind].append(f"{rel}/{name}" if rel else name)
+        pending.extend(f"{rel}/{name}" if rel else name for name in entry[2])
+
+    if set(previous) - set(index.dirs):
+        index.changed = True
+    for paths in index.documents.values():
+        paths.sort()
+    return index
+
+
+def load_specs_index(specs_dir: Path, cache_path: Path | None = None) -> SpecsIndex:
+    """Index SPECS/ using (and refreshing) a persisted listing cache."""
+    previous = None
+    if cache_path is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached.get("version") == INDEX_VERSION:
+                previous = cached["dirs"]
+        except (OSError, ValueError, KeyError):
+            previous = None
+
+    index = scan_specs(specs_dir, previous)
+
+    if cache_path is not None and index.changed:
+        try:
+            write_atomic(cache_path, json.dumps({"version": INDEX_VERSION, "dirs": index.dirs}))
+        except OSError:
+            pass  # a read-only .git/ just means no cache
+    return index
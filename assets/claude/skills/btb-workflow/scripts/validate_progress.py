@@ -4,149 +4,450 @@ Validate PROGRESS.md has been updated before allowing a commit.
 
 This script checks:
 1. PROGRESS.md exists in SPECS/
-2. PROGRESS.md has been modified in the current git working tree
+2. PROGRESS.md changes are staged (or, with --worktree, present in the
+   working tree)
 3. Report date is today's date
 4. Session ID matches current branch (if on claude/ branch)
+
+Fields are read from the staged PROGRESS.md, i.e. what is being committed;
+if only the working-tree copy would pass, the report says to stage it.
+
+With --packages (monorepos), every tracked SPECS/PROGRESS.md is a
+package; only packages with staged changes are checked, concurrently,
+and each gets its own report.
+
+With --range A..B (pre-push hooks, CI), every non-merge commit in the
+range must update PROGRESS.md, and each revision of it must carry its
+commit's date and the branch name.
 """
 
 import sys
 from pathlib import Path
 from datetime import datetime
-import subprocess
-import re
-
-
-def find_repo_root() -> Path:
-    """Find the git repository root."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return Path(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        print("Error: Not in a git repository")
-        sys.exit(1)
-
-
-def get_current_branch() -> str:
-    """Get the current git branch name."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return ""
 
+from btb_git import GitError, GitRepo, open_repo
+from progress_doc import ProgressDocument, load_progress, parse_lines
 
-def is_file_modified(file_path: Path) -> bool:
-    """Check if file has been modified (staged or unstaged)."""
-    try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain", str(file_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return len(result.stdout.strip()) > 0
-    except subprocess.CalledProcessError:
-        return False
+DATE_FORMAT = "%B %d, %Y"  # e.g., "October 28, 2025"
 
 
-def validate_progress_report(progress_path: Path) -> tuple[bool, list[str]]:
-    """Validate PROGRESS.md content.
+def check_document(
+    doc: ProgressDocument,
+    branch: str,
+    dates: list[str],
+    date_label: str = "today's date",
+) -> list[str]:
+    """Check the Report Date, Session and Branch fields of a parsed PROGRESS.md.
 
-    Returns:
-        (is_valid, list_of_errors)
+    `dates` are the acceptable Report Dates, described as `date_label`.
     """
     errors = []
 
-    if not progress_path.exists():
-        errors.append(f"PROGRESS.md not found at {progress_path}")
-        return False, errors
-
-    content = progress_path.read_text()
-
     # Check for report date
-    today = datetime.now().strftime("%B %d, %Y")  # e.g., "October 28, 2025"
-    date_pattern = r"\*\*Report Date\*\*:\s*(.+)"
-    date_match = re.search(date_pattern, content)
-
-    if not date_match:
+    if doc.report_date is None:
         errors.append("Missing **Report Date** field in PROGRESS.md")
-    elif date_match.group(1).strip() != today:
+    elif doc.report_date not in dates:
+        expected = " or ".join(f"'{date}'" for date in dict.fromkeys(dates))
         errors.append(
-            f"PROGRESS.md date is '{date_match.group(1).strip()}', "
-            f"expected today's date '{today}'"
+            f"PROGRESS.md date is '{doc.report_date}', "
+            f"expected {date_label} {expected}"
         )
 
     # Check for session ID on claude/ branches
-    branch = get_current_branch()
     if branch.startswith("claude/"):
-        session_pattern = r"\*\*Session\*\*:\s*(.+)"
-        session_match = re.search(session_pattern, content)
-
-        if not session_match:
+        if doc.session is None:
             errors.append("Missing **Session** field in PROGRESS.md")
-        else:
-            session_in_doc = session_match.group(1).strip()
+        elif not doc.session:
             # Extract session from branch name (claude/session-XXX or ships/experiment/...)
-            if not session_in_doc:
-                errors.append("**Session** field is empty")
+            errors.append("**Session** field is empty")
 
     # Check for branch name
-    branch_pattern = r"\*\*Branch\*\*:\s*`(.+?)`"
-    branch_match = re.search(branch_pattern, content)
-
-    if not branch_match:
+    if doc.branch is None:
         errors.append("Missing **Branch** field in PROGRESS.md")
-    elif branch_match.group(1).strip() != branch:
+    elif doc.branch != branch:
         errors.append(
-            f"PROGRESS.md branch is '{branch_match.group(1).strip()}', "
+            f"PROGRESS.md branch is '{doc.branch}', "
             f"but current branch is '{branch}'"
         )
 
+    return errors
+
+
+def validate_progress_report(
+    progress_path: Path, branch: str | None = None
+) -> tuple[bool, list[str]]:
+    """Validate PROGRESS.md content against `branch` (default: checked out).
+
+    Returns:
+        (is_valid, list_of_errors)
+    """
+    if not progress_path.exists():
+        return False, [f"PROGRESS.md not found at {progress_path}"]
+
+    doc = load_progress(progress_path, header_only=True)
+    today = datetime.now().strftime(DATE_FORMAT)
+    if branch is None:
+        branch = open_repo().current_branch()
+    errors = check_document(doc, branch, [today])
     return len(errors) == 0, errors
 
 
-def main():
-    """Main validation logic."""
-    repo_root = find_repo_root()
-    progress_path = repo_root / "SPECS" / "PROGRESS.md"
+def find_progress(repo: GitRepo) -> Path:
+    """Locate PROGRESS.md (default: SPECS/PROGRESS.md)."""
+    specs_dir = repo.root / "SPECS"
+    progress_path = specs_dir / "PROGRESS.md"
+    if not progress_path.is_file():
+        # Only a differently-cased name needs the SPECS/ index
+        from specs_index import SPECS_INDEX_CACHE, load_specs_index
+
+        index = load_specs_index(specs_dir, repo.git_dir / SPECS_INDEX_CACHE)
+        progress_path = next(iter(index.find("PROGRESS.md")), progress_path)
+    return progress_path
+
 
-    print("🔍 BTB Pre-Commit Validation")
-    print(f"Repository: {repo_root}")
-    print(f"Branch: {get_current_branch()}\n")
+def check_staged(
+    repo: GitRepo, progress_path: Path, staged: bytes, branch: str, unstaged: bool
+) -> list[str]:
+    """Check the staged PROGRESS.md content; returns the errors.
+
+    When the working-tree file also differs (`unstaged`) and would pass,
+    the errors end with a hint to stage it.
+    """
+    doc = parse_lines(staged.decode(errors="replace").splitlines(), header_only=True)
+    errors = check_document(doc, branch, [datetime.now().strftime(DATE_FORMAT)])
+    if errors and unstaged and validate_progress_report(progress_path, branch)[0]:
+        rel = progress_path.relative_to(repo.root).as_posix()
+        errors.append(
+            f"The working-tree PROGRESS.md passes; stage it with `git add {rel}`"
+        )
+    return errors
+
+
+def validate(
+    repo: GitRepo,
+    progress_path: Path,
+    state: dict | None = None,
+    worktree: bool = False,
+) -> tuple[int, list[str]]:
+    """Run the pre-commit checks and return the exit code and report lines.
+
+    Checks the staged PROGRESS.md (what is being committed), or the
+    working-tree file with `worktree`. `state` is a `GitRepo.status()`
+    result for PROGRESS.md; it is fetched when not given.
+    """
+    rel = progress_path.relative_to(repo.root).as_posix()
+    # Branch, upstream and PROGRESS.md state from a single git call
+    if state is None:
+        try:
+            state = repo.status(rel)
+        except GitError as e:
+            return 1, [f"Error: {e}"]
+    branch = state["branch"] or ""
+
+    report = [
+        "🔍 BTB Pre-Commit Validation",
+        f"Repository: {repo.root}",
+        f"Branch: {branch}",
+    ]
+    if state["upstream"]:
+        report.append(
+            f"Upstream: {state['upstream']} "
+            f"(ahead {state['ahead']}, behind {state['behind']})"
+        )
+    report.append("")
 
     # Check if PROGRESS.md has been modified
-    if not is_file_modified(progress_path):
-        print("❌ PROGRESS.md has not been updated")
-        print("\nBTB Rule: PROGRESS.md must be updated before each commit.")
-        print("Update SPECS/PROGRESS.md to reflect current status and try again.")
-        sys.exit(1)
+    xy = state["changes"].get(rel)
+    if xy is None:
+        report.append("❌ PROGRESS.md has not been updated")
+        report.append("\nBTB Rule: PROGRESS.md must be updated before each commit.")
+        report.append(
+            "Update SPECS/PROGRESS.md to reflect current status and try again."
+        )
+        return 1, report
 
     # Validate PROGRESS.md content
-    is_valid, errors = validate_progress_report(progress_path)
+    if worktree:
+        is_valid, errors = validate_progress_report(progress_path, branch)
+    else:
+        if xy == "??" or xy[0] == ".":
+            report.append("❌ PROGRESS.md changes are not staged")
+            report.append(f"\nStage them with `git add {rel}` and try again.")
+            return 1, report
+        try:
+            staged = repo.index_blobs([rel]).get(rel)
+        except GitError as e:
+            return 1, [*report, f"Error: {e}"]
+        if staged is None:
+            report.append("❌ PROGRESS.md is deleted in the staged changes")
+            return 1, report
+        errors = check_staged(
+            repo, progress_path, staged, branch, unstaged=xy[1] != "."
+        )
+        is_valid = not errors
 
     if not is_valid:
-        print("❌ PROGRESS.md validation failed:\n")
+        report.append("❌ PROGRESS.md validation failed:\n")
         for error in errors:
-            print(f"  • {error}")
-        print("\nFix the errors above and try again.")
-        sys.exit(1)
-
-    print("✅ PROGRESS.md validation passed")
-    print("   • File has been modified")
-    print("   • Date is current")
-    print("   • Branch matches")
-    print("\nReady to commit!")
-    sys.exit(0)
+            report.append(f"  • {error}")
+        report.append("\nFix the errors above and try again.")
+        return 1, report
+
+    report.append("✅ PROGRESS.md validation passed")
+    report.append(
+        "   • File has been modified" if worktree else "   • Changes are staged"
+    )
+    report.append("   • Date is current")
+    report.append("   • Branch matches")
+    if not worktree and xy[1] != ".":
+        report.append(
+            "\n⚠️  PROGRESS.md has unstaged changes that will not be committed"
+        )
+    report.append("\nReady to commit!")
+    return 0, report
+
+
+PACKAGE_PROGRESS = "SPECS/PROGRESS.md"
+
+
+def find_packages(repo: GitRepo) -> dict[str, Path]:
+    """Map package directories (repo-relative, "" for the root) to their PROGRESS.md."""
+    output = repo.run("ls-files", "-z", "--", f":(glob)**/{PACKAGE_PROGRESS}")
+    packages = {}
+    for rel in filter(None, output.split("\0")):
+        packages[rel[: -len(PACKAGE_PROGRESS)].rstrip("/")] = repo.root / rel
+    return packages
+
+
+def staged_packages(repo: GitRepo, packages: dict[str, Path]) -> dict[str, set[str]]:
+    """Staged paths grouped by package; a path belongs to its nearest package."""
+    output = repo.run("diff", "--cached", "--name-only", "--no-renames", "-z")
+    staged: dict[str, set[str]] = {}
+    for path in filter(None, output.split("\0")):
+        directory = path.rpartition("/")[0]
+        while directory and directory not in packages:
+            directory = directory.rpartition("/")[0]
+        if directory in packages:
+            staged.setdefault(directory, set()).add(path)
+    return staged
+
+
+def validate_packages(repo: GitRepo, worktree: bool = False) -> tuple[int, list[str]]:
+    """Check the PROGRESS.md of every package with staged changes.
+
+    Two git calls (ls-files and diff --cached) cover any number of
+    packages: a package passes only if its PROGRESS.md is staged too. The
+    staged PROGRESS.md files (or, with `worktree`, the working-tree files)
+    are read in one batch and checked concurrently.
+    """
+    try:
+        packages = find_packages(repo)
+        staged = staged_packages(repo, packages)
+        touched = sorted(staged)
+        rels = {
+            package: packages[package].relative_to(repo.root).as_posix()
+            for package in touched
+        }
+        blobs = (
+            {}
+            if worktree
+            else repo.index_blobs(
+                [rel for package, rel in rels.items() if rel in staged[package]]
+            )
+        )
+    except GitError as e:
+        return 1, [f"Error: {e}"]
+    branch = repo.current_branch()
+
+    report = [
+        f"🔍 BTB Pre-Commit Validation "
+        f"({len(touched)} of {len(packages)} packages with staged changes)",
+        f"Repository: {repo.root}",
+        f"Branch: {branch}",
+    ]
+
+    def check(package: str) -> tuple[bool, list[str]]:
+        path, rel = packages[package], rels[package]
+        if rel not in staged[package]:
+            return False, ["❌ PROGRESS.md changes are not staged with the package"]
+        if worktree:
+            errors = validate_progress_report(path, branch)[1]
+        elif rel not in blobs:
+            errors = ["PROGRESS.md is deleted in the staged changes"]
+        else:
+            try:
+                unstaged = path.read_bytes() != blobs[rel]
+            except OSError:
+                unstaged = False
+            errors = check_staged(repo, path, blobs[rel], branch, unstaged)
+        if errors:
+            return False, [
+                "❌ PROGRESS.md validation failed:",
+                *(f"  • {e}" for e in errors),
+            ]
+        return True, ["✅ PROGRESS.md validation passed"]
+
+    if len(touched) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(touched))) as pool:
+            results = list(pool.map(check, touched))
+    else:
+        results = [check(package) for package in touched]
+
+    for package, (_, lines) in zip(touched, results):
+        report.append(f"\n📦 {package or '. (root)'}")
+        report.extend(f"   {line}" for line in lines)
+
+    if not touched:
+        report.append("\nNo staged changes in any BTB package.")
+        return 0, report
+    failed = sum(not is_valid for is_valid, _ in results)
+    if failed:
+        report.append(f"\n{failed} of {len(touched)} packages failed.")
+        report.append(
+            "BTB Rule: stage each package's SPECS/PROGRESS.md with its changes."
+        )
+        return 1, report
+    report.append("\nReady to commit!")
+    return 0, report
+
+
+def validate_range(repo: GitRepo, rev_range: str, branch: str) -> tuple[int, list[str]]:
+    """Check that every non-merge commit in `rev_range` updates PROGRESS.md validly.
+
+    One streamed `git log --name-only` pass finds the commits that touch
+    PROGRESS.md; their revisions of it are then read in one batch. A
+    revision's Report Date must be its commit's author or committer date.
+    """
+    progress_rel = find_progress(repo).relative_to(repo.root).as_posix()
+    commits = []
+    try:
+        for line in repo.stream(
+            "log",
+            "--no-merges",
+            "--no-renames",
+            "--name-only",
+            "--format=%x1e%H%x1f%aI%x1f%cI%x1f%s",
+            rev_range,
+            "--",
+        ):
+            if line.startswith("\x1e"):
+                sha, authored, committed, subject = line[1:].split("\x1f", 3)
+                dates = [
+                    datetime.fromisoformat(authored).strftime(DATE_FORMAT),
+                    datetime.fromisoformat(committed).strftime(DATE_FORMAT),
+                ]
+                commits.append(
+                    {"sha": sha, "subject": subject, "dates": dates, "touched": False}
+                )
+            elif line == progress_rel:
+                commits[-1]["touched"] = True
+    except GitError as e:
+        return 1, [f"Error: {e}"]
+
+    touched = [commit for commit in commits if commit["touched"]]
+    blobs = repo.read_blobs([f"{commit['sha']}:{progress_rel}" for commit in touched])
+    for commit, blob in zip(touched, blobs):
+        if blob is None:
+            commit["errors"] = [f"{progress_rel} was deleted"]
+        else:
+            doc = parse_lines(
+                blob.decode(errors="replace").splitlines(), header_only=True
+            )
+            commit["errors"] = check_document(
+                doc, branch, commit["dates"], "the commit date"
+            )
+
+    report = [
+        f"🔍 BTB Range Validation: {rev_range}",
+        f"Repository: {repo.root}",
+        f"Branch: {branch}",
+        "",
+    ]
+    failed = 0
+    for commit in reversed(commits):
+        errors = (
+            commit.get("errors", [])
+            if commit["touched"]
+            else [f"{progress_rel} not updated"]
+        )
+        if errors:
+            failed += 1
+            report.append(f"❌ {commit['sha'][:7]} {commit['subject']}")
+            report.extend(f"  • {error}" for error in errors)
+
+    if not commits:
+        report.append("No commits to validate in this range.")
+        return 0, report
+    if failed:
+        report.append(f"\n{failed} of {len(commits)} commits failed.")
+        report.append("BTB Rule: PROGRESS.md must be updated in every commit.")
+        return 1, report
+    report.append(
+        f"✅ All {len(commits)} commits update PROGRESS.md "
+        "with a valid date and branch"
+    )
+    return 0, report
+
+
+def main(argv: list[str] | None = None):
+    """Main validation logic."""
+    argv = sys.argv[1:] if argv is None else argv
+    args = None
+    if argv:
+        # argparse is only imported when there are options to parse
+        import argparse
+
+        parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument(
+            "--packages",
+            action="store_true",
+            help=(
+                "Monorepo mode: check every SPECS/PROGRESS.md "
+                "whose package has staged changes"
+            ),
+        )
+        mode.add_argument(
+            "--range",
+            metavar="A..B",
+            help=(
+                "Check every commit in a range instead of the working tree "
+                "(pre-push, CI)"
+            ),
+        )
+        parser.add_argument(
+            "--worktree",
+            action="store_true",
+            help="Check the working-tree PROGRESS.md instead of the staged version",
+        )
+        parser.add_argument(
+            "--branch",
+            help=(
+                "Branch name PROGRESS.md must record with --range "
+                "(default: current branch)"
+            ),
+        )
+        args = parser.parse_args(argv)
+        if args.branch and not args.range:
+            parser.error("--branch requires --range")
+        if args.worktree and args.range:
+            parser.error("--worktree cannot be combined with --range")
+
+    repo = open_repo()
+    if args and args.range:
+        code, report = validate_range(
+            repo, args.range, args.branch or repo.current_branch()
+        )
+    elif args and args.packages:
+        code, report = validate_packages(repo, args.worktree)
+    else:
+        code, report = validate(
+            repo, find_progress(repo), worktree=bool(args and args.worktree)
+        )
+    print("\n".join(report))
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -7,46 +7,67 @@ This script initializes a new Python project using uv with:
 - Pre-commit hooks configured
 - Git repository initialized
 - Python version specified
+
+Steps are declared as a dependency graph and run concurrently, so git
+init, file writes and test scaffolding overlap with `uv add --dev`.
+
+With --offline, dev dependencies are installed without network access
+from a wheelhouse populated ahead of time with --populate-wheelhouse
+(one directory per Python version and platform), or from the uv cache.
+
+With --workspace, the project becomes a uv workspace root and each named
+member is scaffolded under packages/. The members are written from a
+template and declared as workspace dependencies of the root, so a single
+`uv add --dev` resolves and locks the whole workspace, and there is one
+git repository and one pre-commit install.
+
+With --trace FILE, every step and command records its start and end time,
+exit code and output sizes, written as Chrome trace events (open the file
+in chrome://tracing or https://ui.perfetto.dev).
+
+With --template, projects are cloned from a prebuilt "golden" project
+(resolved lock and installed hooks) kept per Python version and dev
+toolchain, renamed, and given a .venv synced offline from uv's cache. The
+template is rebuilt only when the Python version, dev dependencies or
+generated files change.
 """
 
 import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import sysconfig
+import tempfile
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from graphlib import TopologicalSorter
 from pathlib import Path
 
 
-def run_command(cmd: list[str], cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    print(f"Running: {' '.join(cmd)}")
-    return subprocess.run(cmd, cwd=cwd, check=check, capture_output=True, text=True)
-
-
-def init_project(project_name: str, python_version: str = "3.12", with_git: bool = True) -> None:
-    """Initialize a new uv project with best practices."""
-    project_path = Path(project_name)
+DEV_DEPENDENCIES = ["pytest", "pytest-cov", "ruff", "mypy", "pre-commit"]
 
-    # Initialize uv project
-    print(f"\nInitializing uv project: {project_name}")
-    run_command(["uv", "init", project_name])
+DEFAULT_WHEELHOUSE = Path("~/.cache/init-uv-project/wheelhouse").expanduser()
+WHEELHOUSE_MANIFEST = "dev-requirements.txt"
+# Needed offline to install the project itself and (editable) workspace members
+BUILD_BACKENDS = ["uv_build", "hatchling", "editables"]
 
-    # Set Python version
-    print(f"\nSetting Python version to {python_version}")
-    version_file = project_path / ".python-version"
-    version_file.write_text(f"{python_version}\n")
+DEFAULT_TEMPLATES = Path("~/.cache/init-uv-project/templates").expanduser()
+# Distinctive so that patching it to the new project's name is unambiguous
+GOLDEN_NAME = "uv-golden-template-project"
+GOLDEN_MODULE = GOLDEN_NAME.replace("-", "_")
 
-    # Add development dependencies
-    print("\nAdding development dependencies...")
-    dev_deps = ["pytest", "pytest-cov", "ruff", "mypy", "pre-commit"]
-    run_command(["uv", "add", "--dev"] + dev_deps, cwd=project_path)
+# Command output lines kept for error reports, and the longest line buffered
+TAIL_LINES = 50
+MAX_LINE_BYTES = 64 * 1024
 
-    # Initialize git if requested
-    if with_git:
-        print("\nInitializing git repository...")
-        run_command(["git", "init"], cwd=project_path)
-
-        # Create .gitignore
-        gitignore = project_path / ".gitignore"
-        gitignore.write_text("""# Python
+GITIGNORE = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -92,12 +113,9 @@ Thumbs.db
 
 # UV
 uv.lock
-""")
+"""
 
-    # Copy pre-commit config template
-    print("\nSetting up pre-commit hooks...")
-    precommit_config = project_path / ".pre-commit-config.yaml"
-    precommit_config.write_text("""repos:
+PRECOMMIT_CONFIG = """repos:
   - repo: local
     hooks:
       - id: ruff-import-sorting
@@ -124,24 +142,581 @@ uv.lock
         language: system
         pass_filenames: false
         stages: [pre-push]
-""")
+"""
 
-    # Install pre-commit hooks
-    run_command(["uv", "run", "pre-commit", "install", "--hook-type", "pre-commit", "--hook-type", "pre-push"], cwd=project_path)
+# Member packages of a workspace; written directly so that adding members
+# costs file writes rather than a `uv init` each
+WORKSPACE_DIR = "packages"
 
-    # Create basic test directory
-    tests_dir = project_path / "tests"
-    tests_dir.mkdir(exist_ok=True)
-    (tests_dir / "__init__.py").touch()
+MEMBER_PYPROJECT = """[project]
+name = "{name}"
+version = "0.1.0"
+description = "Add your description here"
+requires-python = ">={python_version}"
+dependencies = []
 
-    # Create a basic test file
-    test_file = tests_dir / "test_example.py"
-    test_file.write_text("""def test_example():
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+"""
+
+MEMBER_TEST = """import {module}
+
+
+def test_import():
+    \"\"\"The package is importable from the workspace environment.\"\"\"
+    assert {module}.__name__ == "{module}"
+"""
+
+EXAMPLE_TEST = """def test_example():
     \"\"\"Example test.\"\"\"
     assert True
-""")
+"""
+
+
+class Trace:
+    """Chrome trace events for the steps and commands of one run.
+
+    Each step gets its own lane (thread id), so concurrent steps show up
+    side by side; commands land in the lane of the step that ran them.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.events: list[dict] = []
+        self.lanes: dict[str, int] = {}
+
+    def record(self, name: str, category: str, started: float, args: dict) -> None:
+        """Add a complete event that began at perf_counter() `started` and ends now."""
+        lane = current_step.get()
+        if lane not in self.lanes:
+            self.lanes[lane] = len(self.lanes)
+            self.events.append(
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": self.lanes[lane], "args": {"name": lane}}
+            )
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self.started) * 1e6),
+                "dur": round((time.perf_counter() - started) * 1e6),
+                "pid": os.getpid(),
+                "tid": self.lanes[lane],
+                "args": args,
+            }
+        )
+
+    def write(self, path: Path) -> None:
+        """Write the trace file and print the step durations, slowest first."""
+        path.write_text(json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}, indent=1) + "\n")
+        steps = sorted((e for e in self.events if e.get("cat") == "step"), key=lambda e: -e["dur"])
+        print(f"\n📊 Step timings (trace written to {path}):")
+        for event in steps:
+            print(f"  {event['name']:<20} {event['dur'] / 1e6:>7.2f}s  {event['args']['status']}")
+
+
+# The trace of this run when --trace is given, and the step running in the current task
+trace: Trace | None = None
+current_step: ContextVar[str] = ContextVar("current_step", default="main")
+
+
+async def stream_lines(stream: asyncio.StreamReader, sink, tail: deque, prefix: str) -> int:
+    """Echo a subprocess stream line by line, keeping the last lines in `tail`.
+
+    Reads fixed-size chunks, so memory stays bounded however much a command
+    prints; a line longer than MAX_LINE_BYTES is split. Returns the byte count.
+    """
+    size = 0
+    pending = b""
+
+    def emit(line: bytes) -> None:
+        text = line.decode(errors="replace").rstrip("\r")
+        tail.append(text)
+        print(f"{prefix}{text}", file=sink, flush=True)
+
+    while chunk := await stream.read(65536):
+        size += len(chunk)
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            emit(line)
+        if len(pending) > MAX_LINE_BYTES:
+            emit(pending)
+            pending = b""
+    if pending:
+        emit(pending)
+    return size
+
+
+async def run_command(
+    cmd: list[str], cwd: Path | None = None, check: bool = True, prefix: str | None = None
+) -> subprocess.CompletedProcess:
+    """Run a command without blocking other steps and stream its output.
+
+    Output lines are echoed as they arrive, prefixed with `prefix` (by
+    default the name of the running step, since steps run concurrently).
+    Only the last TAIL_LINES lines of each stream are kept, and the result's
+    stdout and stderr hold just those for error reports.
+    """
+    print(f"Running: {' '.join(cmd)}")
+    if prefix is None:
+        step = current_step.get()
+        prefix = f"  [{step}] " if step != "main" else "  "
+    started = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout_tail: deque[str] = deque(maxlen=TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=TAIL_LINES)
+    try:
+        stdout_bytes, stderr_bytes = await asyncio.gather(
+            stream_lines(proc.stdout, sys.stdout, stdout_tail, prefix),
+            stream_lines(proc.stderr, sys.stderr, stderr_tail, prefix),
+        )
+        await proc.wait()
+    except asyncio.CancelledError:
+        # Another step failed: don't leave this command running behind us
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if trace:
+        trace.record(
+            " ".join(cmd[:2]),
+            "command",
+            started,
+            {
+                "cmd": cmd,
+                "cwd": str(cwd or "."),
+                "exit_code": proc.returncode,
+                "stdout_bytes": stdout_bytes,
+                "stderr_bytes": stderr_bytes,
+            },
+        )
+    result = subprocess.CompletedProcess(cmd, proc.returncode, "\n".join(stdout_tail), "\n".join(stderr_tail))
+    if check:
+        result.check_returncode()
+    return result
+
+
+async def run_steps(steps: dict[str, tuple[tuple[str, ...], Callable[[], Awaitable[None]]]]) -> None:
+    """Run steps concurrently, each as soon as the steps it depends on have finished.
+
+    `steps` maps a step name to (dependencies, async action). If a step
+    fails, the steps still running are cancelled and the error is raised.
+    """
+
+    async def timed(name: str, action: Callable[[], Awaitable[None]]) -> None:
+        # Each task runs in a copy of the context, so this only labels this step
+        current_step.set(name)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            await action()
+            status = "ok"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            if trace:
+                trace.record(name, "step", started, {"status": status})
+
+    sorter = TopologicalSorter({name: deps for name, (deps, _) in steps.items()})
+    sorter.prepare()
+    running: dict[asyncio.Task, str] = {}
+    try:
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                running[asyncio.create_task(timed(name, steps[name][1]))] = name
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                task.result()
+                sorter.done(name)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+def wheelhouse_dir(root: Path, python_version: str) -> Path:
+    """The wheelhouse for one Python version on this platform."""
+    return root / f"py{python_version}-{sysconfig.get_platform()}"
+
+
+def environment_marker(python_version: str) -> str:
+    """The single environment offline projects resolve for: this platform and Python."""
+    return f"sys_platform == '{sys.platform}' and python_version == '{python_version}'"
+
+
+async def download_wheels(target: Path, python_version: str) -> None:
+    """Lock the dev toolchain for this environment and download every locked package.
+
+    Resolving with uv (as `uv add` will later) and downloading each locked
+    package with --no-deps also fetches marker-gated branches that a plain
+    `pip download` skips for this interpreter, such as tomli for
+    pre-releases of Python 3.11.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        requirements = DEV_DEPENDENCIES + BUILD_BACKENDS
+        dependencies = ", ".join(f'"{name}"' for name in requirements)
+        marker = environment_marker(python_version)
+        (project / "pyproject.toml").write_text(
+            f'[project]\nname = "wheelhouse"\nversion = "0"\n'
+            f'requires-python = ">={python_version}"\n'
+            f"dependencies = [{dependencies}]\n"
+            f'\n[tool.uv]\nenvironments = ["{marker}"]\n'
+        )
+        await run_command(["uv", "lock", "--python", python_version], cwd=project)
+        export = ["uv", "export", "--frozen", "--no-hashes", "--no-annotate"]
+        exported = await run_command(
+            [*export, "--no-header", "--no-emit-project"], cwd=project, prefix=""
+        )
+        # Markers are dropped: the lock only holds branches of this environment
+        pins = [line.split(";")[0].strip() for line in exported.stdout.splitlines()]
+        pins = [pin for pin in pins if pin and pin[0] != "#"]
+        (project / "requirements.txt").write_text("\n".join(pins))
+        download = ["uvx", "pip", "download", "--no-deps", "--only-binary", ":all:"]
+        download += ["--python-version", python_version, "--dest", str(target)]
+        await run_command([*download, "-r", "requirements.txt"], cwd=project)
+
 
-    print(f"\n✅ Project {project_name} initialized successfully!")
+def populate_wheelhouse(root: Path, python_version: str) -> Path:
+    """Download wheels for the dev dependencies (and their dependencies) ahead of time.
+
+    The build backends of generated projects (uv_build) and workspace
+    members (hatchling, with editables) are downloaded too. The wheels only cover this
+    platform and `python_version`, which is why offline projects pin
+    their resolution to that environment.
+    """
+    target = wheelhouse_dir(root, python_version)
+    target.mkdir(parents=True, exist_ok=True)
+    print(f"\nDownloading dev dependency wheels for Python {python_version}")
+    print(f"into {target}")
+    asyncio.run(download_wheels(target, python_version))
+    # Written last: offline mode only trusts a wheelhouse with a manifest
+    (target / WHEELHOUSE_MANIFEST).write_text("\n".join(DEV_DEPENDENCIES) + "\n")
+    return target
+
+
+def offline_source(root: Path, python_version: str) -> Path | None:
+    """The populated wheelhouse for `python_version`, or None to use the uv cache."""
+    target = wheelhouse_dir(root, python_version)
+    manifest = target / WHEELHOUSE_MANIFEST
+    if not manifest.exists():
+        return None
+    if manifest.read_text().split() != DEV_DEPENDENCIES:
+        print(f"⚠️  {target} was populated for other dev dependencies;")
+        print("   run --populate-wheelhouse to refresh it")
+    return target
+
+
+def pin_environment(project_path: Path, python_version: str) -> None:
+    """Restrict uv's resolution to this platform and Python version.
+
+    uv resolves for every platform and supported Python by default, which
+    needs dependencies gated on other environments (colorama on Windows,
+    say) that a wheelhouse for this machine does not contain.
+    """
+    marker = environment_marker(python_version)
+    with open(project_path / "pyproject.toml", "a") as f:
+        f.write(f'\n[tool.uv]\nenvironments = ["{marker}"]\n')
+
+
+def add_workspace(project_path: Path, members: list[str], python_version: str) -> None:
+    """Scaffold workspace members and declare them as dependencies of the root.
+
+    Depending on every member with `workspace = true` sources means the
+    root's `uv add --dev` locks and installs all of them in one resolution.
+    """
+    for name in members:
+        module = name.replace("-", "_")
+        member_path = project_path / WORKSPACE_DIR / name
+        package_dir = member_path / "src" / module
+        package_dir.mkdir(parents=True)
+        (package_dir / "__init__.py").write_text(f'"""{name} package."""\n')
+        (member_path / "pyproject.toml").write_text(MEMBER_PYPROJECT.format(name=name, python_version=python_version))
+        (member_path / "tests").mkdir()
+        (member_path / "tests" / f"test_{module}.py").write_text(MEMBER_TEST.format(module=module))
+
+    pyproject = project_path / "pyproject.toml"
+    content = pyproject.read_text()
+    if "dependencies = []" not in content:
+        raise RuntimeError(f"Unexpected {pyproject} layout: cannot add workspace members")
+    dependencies = "".join(f'\n    "{name}",' for name in members)
+    content = content.replace("dependencies = []", f"dependencies = [{dependencies}\n]", 1)
+    content += f'\n[tool.uv.workspace]\nmembers = ["{WORKSPACE_DIR}/*"]\n\n[tool.uv.sources]\n'
+    content += "".join(f"{name} = {{ workspace = true }}\n" for name in members)
+    pyproject.write_text(content)
+
+
+async def build_project(
+    project_name: str,
+    python_version: str = "3.12",
+    with_git: bool = True,
+    offline: bool = False,
+    wheelhouse: Path | None = None,
+    members: list[str] | None = None,
+) -> None:
+    """Create the project, overlapping independent steps with the slow `uv add`.
+
+    With `offline`, uv never touches the network: dev dependencies come
+    from `wheelhouse` (a directory of wheels) or, without one, the uv cache.
+    With `members`, the project is a workspace root and the members are
+    scaffolded before the shared `uv add --dev`.
+    """
+    project_path = Path(project_name)
+    # uv's global --offline for every command; index options for resolving ones
+    offline_flags = ["--offline"] if offline else []
+    local_index = ["--no-index", "--find-links", str(wheelhouse)] if wheelhouse else []
+    resolver_flags = offline_flags + local_index
+
+    async def uv_init() -> None:
+        print(f"\nInitializing uv project: {project_name}")
+        # uv init creates a git repository by default; --no-git means none at all
+        vcs_flags = [] if with_git else ["--vcs", "none"]
+        await run_command(["uv", "init", *offline_flags, *vcs_flags, project_name])
+
+    async def set_python_version() -> None:
+        print(f"\nSetting Python version to {python_version}")
+        (project_path / ".python-version").write_text(f"{python_version}\n")
+
+    async def pin_offline_environment() -> None:
+        print(f"\nPinning the resolution to {sys.platform} / Python {python_version}")
+        pin_environment(project_path, python_version)
+
+    async def add_dev_dependencies() -> None:
+        print("\nAdding development dependencies...")
+        await run_command(
+            ["uv", "add", "--dev", *resolver_flags] + DEV_DEPENDENCIES, cwd=project_path
+        )
+
+    async def git_init() -> None:
+        print("\nInitializing git repository...")
+        await run_command(["git", "init"], cwd=project_path)
+
+    async def write_gitignore() -> None:
+        (project_path / ".gitignore").write_text(GITIGNORE)
+
+    async def write_precommit_config() -> None:
+        print("\nSetting up pre-commit hooks...")
+        (project_path / ".pre-commit-config.yaml").write_text(PRECOMMIT_CONFIG)
+
+    async def install_hooks() -> None:
+        await run_command(
+            ["uv", "run", *resolver_flags, "pre-commit", "install"]
+            + ["--hook-type", "pre-commit", "--hook-type", "pre-push"],
+            cwd=project_path,
+        )
+
+    async def scaffold_members() -> None:
+        print(f"\nAdding {len(members)} workspace members under {WORKSPACE_DIR}/")
+        add_workspace(project_path, members, python_version)
+
+    async def scaffold_tests() -> None:
+        tests_dir = project_path / "tests"
+        tests_dir.mkdir(exist_ok=True)
+        (tests_dir / "__init__.py").touch()
+        (tests_dir / "test_example.py").write_text(EXAMPLE_TEST)
+
+    # name -> (dependencies, action); `uv add` resolves for .python-version
+    steps = {
+        "uv-init": ((), uv_init),
+        "python-version": (("uv-init",), set_python_version),
+        "uv-add-dev": (
+            ("python-version",)
+            + (("workspace",) if members else ())
+            + (("environment",) if offline else ()),
+            add_dev_dependencies,
+        ),
+        "pre-commit-config": (("uv-init",), write_precommit_config),
+        "tests": (("uv-init",), scaffold_tests),
+    }
+    if members:
+        steps["workspace"] = (("uv-init",), scaffold_members)
+    if offline:
+        steps["environment"] = (("uv-init",), pin_offline_environment)
+    if with_git:
+        # pre-commit install needs both the hook tool and a git repository
+        steps["git-init"] = (("uv-init",), git_init)
+        steps["gitignore"] = (("uv-init",), write_gitignore)
+        steps["pre-commit-install"] = (("uv-add-dev", "git-init", "pre-commit-config"), install_hooks)
+
+    await run_steps(steps)
+
+
+def template_key(python_version: str, with_git: bool) -> str:
+    """Name of the template for this Python version and everything the script generates."""
+    inputs = [python_version, with_git, DEV_DEPENDENCIES, GITIGNORE, PRECOMMIT_CONFIG, EXAMPLE_TEST]
+    digest = hashlib.sha256(json.dumps(inputs).encode()).hexdigest()[:16]
+    return f"py{python_version}-{digest}"
+
+
+def template_usable(template: Path) -> bool:
+    """Whether a built template exists and its base interpreter is still installed."""
+    try:
+        info = json.loads((template / "template.json").read_text())
+        pyvenv = (template / GOLDEN_NAME / ".venv" / "pyvenv.cfg").read_text()
+    except (OSError, ValueError):
+        return False
+    home = next((line.split("=", 1)[1].strip() for line in pyvenv.splitlines() if line.startswith("home")), "")
+    return "built_at" in info and Path(home).is_dir()
+
+
+def ensure_template(
+    root: Path,
+    python_version: str,
+    with_git: bool,
+    offline: bool,
+    wheelhouse: Path | None,
+    rebuild: bool = False,
+) -> Path:
+    """Return the golden template directory, building it first if needed."""
+    template = root / template_key(python_version, with_git)
+    if not rebuild and template_usable(template):
+        print(f"\n📋 Using project template {template}")
+        return template
+
+    print(f"\n🏗️  Building project template {template}")
+    root.mkdir(parents=True, exist_ok=True)
+    staging = root / f".{template.name}.{os.getpid()}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    try:
+        golden = (staging / GOLDEN_NAME).resolve()
+        asyncio.run(build_project(str(golden), python_version, with_git, offline, wheelhouse))
+        info = {
+            "built_at": str(golden),
+            "python_version": python_version,
+            "with_git": with_git,
+            "dev_dependencies": DEV_DEPENDENCIES,
+        }
+        (staging / "template.json").write_text(json.dumps(info, indent=2) + "\n")
+        shutil.rmtree(template, ignore_errors=True)
+        os.rename(staging, template)
+    except OSError:
+        if not template_usable(template):  # another run installed it first otherwise
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    # A template for the same Python version and git setting but another key
+    # was built for an older toolchain and is stale now
+    for other in root.glob(f"py{python_version}-*"):
+        if other == template:
+            continue
+        try:
+            info = json.loads((other / "template.json").read_text())
+        except (OSError, ValueError):
+            continue
+        if info.get("python_version") == python_version and info.get("with_git") == with_git:
+            shutil.rmtree(other, ignore_errors=True)
+    return template
+
+
+def normalize_name(name: str) -> str:
+    """The package name `uv init` derives from a directory name (PEP 503 normalized)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+async def clone_template(
+    template: Path, project_path: Path, offline: bool = False, wheelhouse: Path | None = None
+) -> None:
+    """Copy the golden project to `project_path`, rename it and sync its environment.
+
+    The project files, lock and git repository are copied; the golden
+    .venv is not, since its scripts and editable install point into the
+    template. `uv sync --offline` recreates it from uv's cache instead
+    (hardlinking, uv's default), reusing the template's resolved lock, and
+    a final import of the package checks the clone end to end. Unless
+    `offline`, packages evicted from the cache are fetched as a fallback.
+    """
+    golden = template / GOLDEN_NAME
+    if project_path.exists():
+        raise FileExistsError(f"{project_path} already exists")
+    started = time.perf_counter()
+    package = normalize_name(project_path.name)
+    module = package.replace("-", "_")
+    print(f"\nCloning template into {project_path}")
+
+    shutil.copytree(
+        golden,
+        project_path,
+        symlinks=True,
+        ignore=lambda directory, names: [".venv"] if Path(directory) == golden else [],
+    )
+    golden_module = project_path / "src" / GOLDEN_MODULE
+    if golden_module.is_dir():
+        golden_module.rename(project_path / "src" / module)
+
+    built_at = json.loads((template / "template.json").read_text())["built_at"]
+    replacements = [
+        (built_at.encode(), str(project_path.resolve()).encode()),
+        (GOLDEN_NAME.encode(), package.encode()),
+        (GOLDEN_MODULE.encode(), module.encode()),
+    ]
+    # Everything but git's internals embeds nothing else; hooks hold the path
+    candidates = [
+        path
+        for path in project_path.rglob("*")
+        if path.is_file() and not path.is_symlink() and ".git" not in path.relative_to(project_path).parts
+    ]
+    hooks = project_path / ".git" / "hooks"
+    if hooks.is_dir():
+        candidates += [path for path in hooks.iterdir() if path.is_file()]
+    for path in candidates:
+        data = path.read_bytes()
+        patched = data
+        for old, new in replacements:
+            patched = patched.replace(old, new)
+        if patched != data:
+            path.write_bytes(patched)
+
+    offline_flags = ["--offline"] + (["--no-index", "--find-links", str(wheelhouse)] if wheelhouse else [])
+    try:
+        await run_command(["uv", "sync", *offline_flags], cwd=project_path)
+    except subprocess.CalledProcessError:
+        if offline:
+            raise
+        print("⚠️  Packages missing from the uv cache; syncing with network access")
+        await run_command(["uv", "sync"], cwd=project_path)
+    if (project_path / "src" / module).is_dir():
+        await run_command(["uv", "run", *offline_flags, "python", "-c", f"import {module}"], cwd=project_path)
+
+    if trace:
+        trace.record("clone-template", "step", started, {"status": "ok", "template": str(template)})
+
+
+def init_project(
+    project_name: str,
+    python_version: str = "3.12",
+    with_git: bool = True,
+    offline: bool = False,
+    wheelhouse_root: Path = DEFAULT_WHEELHOUSE,
+    members: list[str] | None = None,
+    template_root: Path | None = None,
+    rebuild_template: bool = False,
+) -> None:
+    """Initialize a new uv project (or workspace, with `members`) with best practices.
+
+    With `template_root`, the project is cloned from the golden template
+    kept there instead of being built step by step.
+    """
+    wheelhouse = None
+    if offline:
+        wheelhouse = offline_source(wheelhouse_root, python_version)
+        print(f"\n📦 Offline mode: installing from {wheelhouse or 'the uv cache'}")
+    if template_root:
+        template = ensure_template(template_root, python_version, with_git, offline, wheelhouse, rebuild_template)
+        asyncio.run(clone_template(template, Path(project_name), offline, wheelhouse))
+    else:
+        asyncio.run(build_project(project_name, python_version, with_git, offline, wheelhouse, members))
+
+    if members:
+        print(f"\n✅ Workspace {project_name} initialized with {len(members)} members!")
+    else:
+        print(f"\n✅ Project {project_name} initialized successfully!")
     print(f"\nNext steps:")
     print(f"  cd {project_name}")
     print(f"  uv add <dependencies>")
@@ -150,22 +725,92 @@ uv.lock
 
 def main():
     parser = argparse.ArgumentParser(description="Initialize a new uv project with best practices")
-    parser.add_argument("project_name", help="Name of the project to create")
+    parser.add_argument("project_name", nargs="?", help="Name of the project to create")
     parser.add_argument("--python-version", default="3.12", help="Python version to use (default: 3.12)")
-    parser.add_argument("--no-git", action="store_true", help="Don't initialize git repository")
+    parser.add_argument("--no-git", action="store_true", help="Don't initialize a git repository or install pre-commit hooks")
+    parser.add_argument(
+        "--offline", action="store_true", help="Install dev dependencies without network (wheelhouse or uv cache)"
+    )
+    parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        default=DEFAULT_WHEELHOUSE,
+        help=f"Wheelhouse root, one directory per Python version (default: {DEFAULT_WHEELHOUSE})",
+    )
+    parser.add_argument(
+        "--populate-wheelhouse",
+        action="store_true",
+        help="Download the dev dependency wheels for --python-version into the wheelhouse first",
+    )
+    parser.add_argument(
+        "--workspace",
+        nargs="+",
+        metavar="MEMBER",
+        help=f"Create a uv workspace with these member packages under {WORKSPACE_DIR}/",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Write per-step and per-command timings as Chrome trace events to FILE",
+    )
+    parser.add_argument(
+        "--template",
+        action="store_true",
+        help="Clone a prebuilt golden project (lock, .venv, hooks) instead of building from scratch",
+    )
+    parser.add_argument(
+        "--template-dir",
+        type=Path,
+        default=DEFAULT_TEMPLATES,
+        help=f"Where golden templates are kept (default: {DEFAULT_TEMPLATES})",
+    )
+    parser.add_argument("--rebuild-template", action="store_true", help="Rebuild the golden template before cloning")
 
     args = parser.parse_args()
+    if args.project_name is None and not args.populate_wheelhouse:
+        parser.error("project_name is required unless --populate-wheelhouse is given")
+    if args.workspace:
+        invalid = [name for name in args.workspace if not re.fullmatch(r"[A-Za-z][A-Za-z0-9_-]*", name)]
+        if invalid:
+            parser.error(f"invalid member names: {', '.join(invalid)}")
+        if len(set(args.workspace)) != len(args.workspace) or args.project_name in args.workspace:
+            parser.error("member names must be unique and differ from the workspace name")
+        if args.template or args.rebuild_template:
+            parser.error("--template cannot be combined with --workspace")
+
+    global trace
+    if args.trace:
+        trace = Trace()
 
     try:
-        init_project(args.project_name, args.python_version, not args.no_git)
+        if args.populate_wheelhouse:
+            target = populate_wheelhouse(args.wheelhouse, args.python_version)
+            print(f"\n✅ Wheelhouse ready: {target}")
+            if args.project_name is None:
+                return
+        init_project(
+            args.project_name,
+            args.python_version,
+            not args.no_git,
+            args.offline,
+            args.wheelhouse,
+            args.workspace,
+            template_root=args.template_dir if args.template or args.rebuild_template else None,
+            rebuild_template=args.rebuild_template,
+        )
     except subprocess.CalledProcessError as e:
         print(f"\n❌ Error: Command failed: {e.cmd}", file=sys.stderr)
-        print(f"Output: {e.stdout}", file=sys.stderr)
-        print(f"Error: {e.stderr}", file=sys.stderr)
+        print(f"Output (last {TAIL_LINES} lines): {e.stdout}", file=sys.stderr)
+        print(f"Error (last {TAIL_LINES} lines): {e.stderr}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Written on failure too: a failed or slow run is what needs profiling
+        if trace:
+            trace.write(args.trace)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,26 @@ This script checks:
 - Dependency groups use modern syntax
 - Build system is configured
 - Common configuration issues
+
+Paths may be files, directories or glob patterns. Directories are searched
+recursively for pyproject.toml files, respecting .gitignore inside a git
+repository, and multiple files are validated in parallel on a process pool
+with one combined report and exit status.
+
+Results are cached in .validate_pyproject_cache, keyed on each file's
+content hash and the validator version, so unchanged files are neither
+parsed nor validated again (--no-cache to bypass).
 """
 
 import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -19,12 +35,6 @@ except ImportError:
     import tomllib as tomli
 
 
-def load_pyproject(path: Path) -> dict:
-    """Load and parse pyproject.toml."""
-    with open(path, "rb") as f:
-        return tomli.load(f)
-
-
 def validate_project_section(data: dict) -> list[str]:
     """Validate [project] section."""
     errors = []
@@ -148,7 +158,16 @@ def validate_pytest_config(data: dict) -> list[str]:
 def validate_pyproject(path: Path) -> tuple[list[str], list[str]]:
     """Validate pyproject.toml and return errors and warnings."""
     try:
-        data = load_pyproject(path)
+        content = path.read_bytes()
+    except OSError as e:
+        return [f"Failed to parse pyproject.toml: {e}"], []
+    return validate_content(content)
+
+
+def validate_content(content: bytes) -> tuple[list[str], list[str]]:
+    """Validate pyproject.toml content and return errors and warnings."""
+    try:
+        data = tomli.loads(content.decode())
     except Exception as e:
         return [f"Failed to parse pyproject.toml: {e}"], []
 
@@ -166,19 +185,235 @@ def validate_pyproject(path: Path) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
+# pyproject.toml at any depth, including the top level
+GIT_PATHSPEC = ":(glob)**/pyproject.toml"
+
+# Directories never searched, besides hidden ones
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", "build", "dist"}
+
+
+def skipped_dir(name: str) -> bool:
+    """Whether a directory is never searched for pyproject.toml files."""
+    return name.startswith(".") or name in SKIP_DIRS
+
+
+def find_pyprojects(directory: Path) -> list[Path]:
+    """Find pyproject.toml files under `directory`, skipping ignored paths.
+
+    Inside a git work tree, `git ls-files` lists tracked and untracked
+    files minus everything excluded by .gitignore; elsewhere the tree is
+    walked. Either way, hidden directories and common build/environment
+    ones are skipped.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(directory), "ls-files", "-co", "--exclude-standard", "-z", "--", GIT_PATHSPEC],
+            capture_output=True,
+        )
+    except OSError:
+        proc = None  # git is not installed
+    if proc and proc.returncode == 0:
+        names = [name for name in proc.stdout.decode().split("\0") if name]
+        found = (
+            directory / name
+            for name in names
+            if not any(skipped_dir(part) for part in Path(name).parts[:-1])
+        )
+        # -c also lists tracked files deleted from the work tree
+        return sorted(path for path in found if path.is_file())
+
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not skipped_dir(d)]
+        if "pyproject.toml" in files:
+            found.append(Path(root) / "pyproject.toml")
+    return sorted(found)
+
+
+def collect_paths(targets: list[str]) -> tuple[list[Path], list[str]]:
+    """Expand files, directories and glob patterns; returns (files, targets not found)."""
+    files: dict[Path, None] = {}
+    missing = []
+    for target in targets:
+        if glob.has_magic(target):
+            matches = [Path(match) for match in sorted(glob.glob(target, recursive=True))]
+        else:
+            matches = [Path(target)] if Path(target).exists() else []
+        if not matches:
+            missing.append(target)
+        for match in matches:
+            for path in find_pyprojects(match) if match.is_dir() else [match]:
+                files.setdefault(path, None)
+    return list(files), missing
+
+
+CACHE_DIR = Path(".validate_pyproject_cache")
+# Entries unused for this long are dropped, then the least recently used
+# beyond the entry limit
+CACHE_MAX_AGE = 30 * 24 * 3600
+CACHE_MAX_ENTRIES = 10_000
+
+
+def validator_version() -> str:
+    """Identify this validator: its own source and the Python (TOML parser) version."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(f"{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """On-disk validation results keyed on file content, one file per validator version.
+
+    --strict only changes the exit status, not the errors and warnings
+    found, so strict and non-strict runs share entries.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR):
+        self.directory = directory
+        self.path = directory / f"{validator_version()}.json"
+        try:
+            self.entries: dict[str, dict] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+        self.now = int(time.time())
+        self.dirty = False
+
+    def get(self, key: str) -> tuple[list[str], list[str]] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        # Refresh the last-use time at most daily, so all-hit runs write nothing
+        if self.now - entry["used"] > 24 * 3600:
+            entry["used"] = self.now
+            self.dirty = True
+        return entry["errors"], entry["warnings"]
+
+    def put(self, key: str, errors: list[str], warnings: list[str]) -> None:
+        self.entries[key] = {"errors": errors, "warnings": warnings, "used": self.now}
+        self.dirty = True
+
+    def save(self) -> None:
+        """Evict stale entries and write the cache atomically."""
+        if not self.dirty:
+            return
+        fresh = [(key, entry) for key, entry in self.entries.items() if self.now - entry["used"] <= CACHE_MAX_AGE]
+        fresh.sort(key=lambda item: item[1]["used"], reverse=True)
+        self.entries = dict(fresh[:CACHE_MAX_ENTRIES])
+
+        try:
+            self.directory.mkdir(exist_ok=True)
+            # Like other tool caches: ignored by git and marked for backup tools
+            (self.directory / ".gitignore").write_text("*\n")
+            (self.directory / "CACHEDIR.TAG").write_text("Signature: 8a477f597d28d172789f06886806bc55\n")
+            for stale in self.directory.glob("*.json"):
+                if stale != self.path:  # results of other validator versions
+                    stale.unlink(missing_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, separators=(",", ":")))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️  Could not write the result cache: {e}", file=sys.stderr)
+
+
+def validate_many(
+    paths: list[Path], jobs: int, cache: ResultCache | None = None
+) -> list[tuple[list[str], list[str]]]:
+    """Validate files in parallel, returning (errors, warnings) in input order.
+
+    Files whose content is in `cache` are not parsed; the others are
+    validated from the bytes that were hashed, then added to the cache.
+    """
+    results: list[tuple[list[str], list[str]] | None] = [None] * len(paths)
+    pending: dict[str, tuple[bytes, list[int]]] = {}
+    for i, path in enumerate(paths):
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            results[i] = ([f"Failed to parse pyproject.toml: {e}"], [])
+            continue
+        key = hashlib.sha256(content).hexdigest()
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            # Identical files (common for generated projects) are validated once
+            pending.setdefault(key, (content, []))[1].append(i)
+
+    keys = list(pending)
+    contents = [pending[key][0] for key in keys]
+    workers = min(jobs, len(contents))
+    if workers <= 1:
+        validated = [validate_content(content) for content in contents]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Large chunks: a single file validates much faster than a round trip to a worker
+            validated = list(pool.map(validate_content, contents, chunksize=max(1, len(contents) // (workers * 4))))
+
+    for key, (errors, warnings) in zip(keys, validated):
+        if cache:
+            cache.put(key, errors, warnings)
+        for i in pending[key][1]:
+            results[i] = (errors, warnings)
+    if cache:
+        cache.save()
+    return results
+
+
+def report_many(paths: list[Path], results: list[tuple[list[str], list[str]]], strict: bool) -> int:
+    """Print the combined report for several files and return the exit status."""
+    with_errors = with_warnings = 0
+    for path, (errors, warnings) in zip(paths, results):
+        if not errors and not warnings:
+            continue
+        print(f"\n{'❌' if errors else '⚠️ '} {path}")
+        for error in errors:
+            print(f"  - error: {error}")
+        for warning in warnings:
+            print(f"  - warning: {warning}")
+        with_errors += bool(errors)
+        with_warnings += bool(warnings)
+
+    print(f"\nValidated {len(paths)} pyproject.toml files: {with_errors} with errors, {with_warnings} with warnings")
+    if with_errors or (strict and with_warnings):
+        return 1
+    if not with_warnings:
+        print("✅ All pyproject.toml files are valid!")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate pyproject.toml for uv projects")
-    parser.add_argument("path", nargs="?", default="pyproject.toml", help="Path to pyproject.toml (default: pyproject.toml)")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=["pyproject.toml"],
+        help="pyproject.toml files, directories to search, or glob patterns (default: pyproject.toml)",
+    )
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Parallel worker processes (default: CPU count)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help=f"Don't read or write the {CACHE_DIR} result cache")
 
     args = parser.parse_args()
-    path = Path(args.path)
+    paths, missing = collect_paths(args.paths)
 
-    if not path.exists():
-        print(f"❌ Error: {path} not found", file=sys.stderr)
+    for target in missing:
+        print(f"❌ Error: {target} not found", file=sys.stderr)
+    if missing:
         sys.exit(1)
 
-    errors, warnings = validate_pyproject(path)
+    # One explicit file keeps the single-file report
+    single = len(args.paths) == 1 and not glob.has_magic(args.paths[0]) and Path(args.paths[0]).is_file()
+    if not paths:
+        print("❌ Error: no pyproject.toml files found", file=sys.stderr)
+        sys.exit(1)
+
+    results = validate_many(paths, args.jobs, None if args.no_cache else ResultCache())
+    if not single:
+        sys.exit(report_many(paths, results, args.strict))
+
+    errors, warnings = results[0]
 
     if errors:
         print(f"\n❌ {len(errors)} error(s) found:")